@@ -0,0 +1,91 @@
+# --- Drifting background layer ---
+# Grid lines and pulsing rings whose geometry lives in one NumPy array.
+# Every frame is computed in closed form from the layer's own clock
+# (advanced by the updater's dt), so a frame costs a handful of array ops
+# and nothing compounds: no bounding boxes, no repeated scale() drift.
+# With BAKE_UPDATERS=1 start() replays a baked keyframe track instead.
+
+from manim import *
+
+from baking import bake, baking_enabled
+
+
+class BackgroundLayer(VGroup):
+    def __init__(
+        self,
+        grid_color=BLUE,
+        ring_color=GREEN,
+        grid_range=range(-8, 9, 2),
+        ring_centers=((4, 2, 0), (-5, -1.5, 0), (3, -2.5, 0), (-4, 1.8, 0)),
+        ring_radius=1.5,
+        drift_velocity=(0.008, -0.005, 0),
+        drift_wrap=2.0,
+        pulse_amplitude=0.03,
+        pulse_frequency=0.8,
+        **kwargs,
+    ):
+        super().__init__(**kwargs)
+        self.drift_velocity = np.array(drift_velocity, dtype=float)
+        self.drift_wrap = drift_wrap
+        self.ring_radius = ring_radius
+        self.pulse_amplitude = pulse_amplitude
+        self.pulse_frequency = pulse_frequency
+        self.time = 0.0
+
+        # Straight lines as single cubic segments: 4 points per line
+        segments = []
+        for i in grid_range:
+            segments.append(([i, -5, 0], [i, 5, 0]))
+            segments.append(([-14, i / 2, 0], [14, i / 2, 0]))
+        starts, ends = np.array(segments, dtype=float).transpose(1, 0, 2)
+        weights = np.linspace(0, 1, 4)[None, :, None]
+        grid_points = (starts[:, None] + (ends - starts)[:, None] * weights).reshape(-1, 3)
+
+        # Rings as a unit circle, scaled and placed per frame
+        self.unit_ring = Circle(radius=1).points.copy()
+        self.ring_centers = np.array(ring_centers, dtype=float)
+        ring_points = np.zeros((len(self.ring_centers) * len(self.unit_ring), 3))
+
+        # One array for the whole layer; the two children are styled slices of it
+        self.grid_rest = grid_points
+        self.base = np.vstack([grid_points, ring_points])
+        self.n_grid = len(grid_points)
+
+        self.grid = VMobject(stroke_width=0.5, stroke_opacity=0.08, stroke_color=grid_color)
+        self.rings = VMobject(stroke_width=1, stroke_opacity=0.06, stroke_color=ring_color)
+        self.add(self.grid, self.rings)
+        self.set_time(0.0)
+
+    def drift_offset(self, t):
+        # Same motion as shifting by velocity * dt and jumping back by
+        # drift_wrap whenever the layer passes +/- drift_wrap / 2
+        half = self.drift_wrap / 2
+        offset = self.drift_velocity * t
+        return np.where(
+            self.drift_velocity != 0,
+            np.mod(offset + half, self.drift_wrap) - half,
+            0.0,
+        )
+
+    def ring_scale(self, t):
+        return self.ring_radius * (1 + self.pulse_amplitude * np.sin(t * self.pulse_frequency))
+
+    def set_time(self, t):
+        self.time = t
+        points = self.base
+        points[: self.n_grid] = self.grid_rest + self.drift_offset(t)
+        rings = self.ring_centers[:, None, :] + self.unit_ring[None] * self.ring_scale(t)
+        points[self.n_grid:] = rings.reshape(-1, 3)
+        self.grid.points = points[: self.n_grid].copy()
+        self.rings.points = points[self.n_grid:].copy()
+        return self
+
+    def start(self, bake_updater=None, bake_duration=120):
+        # bake_duration covers the longest scene; past it the last pose holds
+        if bake_updater is None:
+            bake_updater = baking_enabled()
+        if bake_updater:
+            self.add_updater(bake(self, lambda mob, t: mob.set_time(t), bake_duration))
+        else:
+            self.add_updater(lambda mob, dt: mob.set_time(mob.time + dt))
+        return self
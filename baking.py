@@ -0,0 +1,84 @@
+# --- Baked updaters ---
+# bake() turns a pure pose function of time, pose_fn(mob, t), into a
+# keyframe track: the family's points are sampled once, at the render frame
+# rate by default, and replayed by an updater that only interpolates
+# between two keyframes. Tracks live in a registry keyed by a digest of
+# their contents, and the updater holds nothing but that digest and its
+# clock, so play() hashes stay small and stable and identical bakes share
+# one array.
+#
+# Only points are baked; pose_fn must keep every member's point count and
+# leave styles alone. BAKE_UPDATERS=1 opts scenes in.
+
+import hashlib
+import os
+
+import numpy as np
+from manim import config
+
+TRACKS = {}
+
+
+def baking_enabled():
+    return os.environ.get("BAKE_UPDATERS", "0").lower() in ("1", "on", "true")
+
+
+class KeyframeTrack:
+    def __init__(self, keyframes, fps, sizes):
+        self.keyframes = keyframes
+        self.fps = fps
+        self.sizes = sizes
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(np.ascontiguousarray(keyframes).tobytes())
+        digest.update(repr((fps, sizes)).encode())
+        self.digest = digest.hexdigest()
+
+    @property
+    def duration(self):
+        return (len(self.keyframes) - 1) / self.fps
+
+    def at(self, t):
+        # Holds the first and last pose outside the baked range
+        last = len(self.keyframes) - 1
+        x = min(max(t * self.fps, 0.0), last)
+        i = min(int(x), max(last - 1, 0))
+        if i == last:
+            return self.keyframes[i]
+        return self.keyframes[i] + (self.keyframes[i + 1] - self.keyframes[i]) * (x - i)
+
+    def __hash__(self):
+        return hash(self.digest)
+
+    def __eq__(self, other):
+        return isinstance(other, KeyframeTrack) and other.digest == self.digest
+
+
+class BakedUpdater:
+    def __init__(self, digest):
+        self.digest = digest
+        self.time = 0.0
+
+    def __call__(self, mob, dt):
+        self.time += dt
+        track = TRACKS[self.digest]
+        points = track.at(self.time).astype(float)
+        members = mob.family_members_with_points()
+        for member, chunk in zip(members, np.split(points, np.cumsum(track.sizes)[:-1])):
+            member.points = chunk
+
+
+def bake(mob, pose_fn, duration, fps=None):
+    fps = fps or config.frame_rate
+    members = mob.family_members_with_points()
+    sizes = tuple(len(m.points) for m in members)
+    keyframes = np.empty((int(round(duration * fps)) + 1, sum(sizes), 3), dtype=np.float32)
+    for k in range(len(keyframes)):
+        pose_fn(mob, k / fps)
+        if tuple(len(m.points) for m in members) != sizes:
+            raise ValueError("pose_fn must keep every member's point count fixed")
+        keyframes[k] = np.concatenate([m.points for m in members])
+    pose_fn(mob, 0.0)
+
+    track = KeyframeTrack(keyframes, fps, sizes)
+    TRACKS.setdefault(track.digest, track)
+    return BakedUpdater(track.digest)
@@ -0,0 +1,61 @@
+# --- Shared base class for the explainer scenes ---
+
+from manim import *
+
+from culling import CullingCameraMixin
+from dependencies import DependencyMixin
+from determinism import DeterministicMixin
+from frame_pipeline import PipelinedRenderer, pipeline_enabled
+from glow import GlowCameraMixin
+from hashing import FastHashMixin
+from layered_camera import LayeredCamera
+from multi_output import MultiOutputMixin
+from particles import ParticleCameraMixin
+from profiler import ProfilerMixin
+from text_cache import TEXT_CACHE
+from transitions import SnapshotCameraMixin, StageTransitionMixin
+
+
+class ExplainerCamera(
+    CullingCameraMixin,
+    GlowCameraMixin,
+    ParticleCameraMixin,
+    SnapshotCameraMixin,
+    LayeredCamera,
+):
+    pass
+
+
+class ExplainerScene(
+    StageTransitionMixin,
+    DependencyMixin,
+    FastHashMixin,
+    ProfilerMixin,
+    MultiOutputMixin,
+    DeterministicMixin,
+    Scene,
+):
+    def __init__(self, camera_class=ExplainerCamera, renderer=None, skip_animations=False, **kwargs):
+        if renderer is None and pipeline_enabled():
+            renderer = PipelinedRenderer(camera_class=camera_class, skip_animations=skip_animations)
+        super().__init__(camera_class=camera_class, renderer=renderer, skip_animations=skip_animations, **kwargs)
+
+    def tear_down(self):
+        super().tear_down()
+        stats = TEXT_CACHE.stats()
+        logger.info(
+            f"Text cache: {stats['hits']} hits, {stats['disk_hits']} disk hits, "
+            f"{stats['misses']} misses ({stats['entries']} entries)"
+        )
+        if getattr(self.camera, "layered", False):
+            stats = self.camera.layer_stats
+            logger.info(
+                f"Layered render: {stats['hits']} cached layer reuses, "
+                f"{stats['builds']} layer builds, {stats['direct']} mobject draws"
+            )
+        if getattr(self.camera, "cull", False):
+            stats = self.camera.cull_stats
+            logger.info(
+                f"Culling: {stats['mobjects']} mobject draws and {stats['curves']} curves "
+                f"skipped ({stats['points']} points)"
+            )
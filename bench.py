@@ -0,0 +1,146 @@
+# --- Render benchmarks ---
+# Renders every scene, plus the synthetic scenes in benchmarks/micro.py, at
+# low quality with caching disabled, one fresh process per scene. Reports
+# frames/sec, wall time, peak RSS and partial-movie cache size, and
+# compares against bench_baseline.json.
+#
+#   python bench.py --save-baseline      # record the current numbers
+#   python bench.py --threshold 10       # fail if anything is >10% worse
+#   python bench.py --hash               # time play() hashing, JSON vs blake2
+
+import argparse
+import json
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from render_all import ROOT, discover_scenes, load_scene, render_scene, scene_config
+
+BASELINE = ROOT / "bench_baseline.json"
+MICRO_SCENES = [
+    ("benchmarks.micro", "LargeFlashBench"),
+    ("benchmarks.micro", "LargeFastFlashBench"),
+    ("benchmarks.micro", "MeshWiggleBench"),
+    ("benchmarks.micro", "FullMeshJitterBench"),
+    ("benchmarks.micro", "ParticleBurstBench"),
+    ("benchmarks.micro", "ParticleSystemBurstBench"),
+    ("benchmarks.micro", "BinaryRainBench"),
+]
+# Lower is better for every compared metric
+COMPARED = ("wall_time", "peak_rss_mb")
+
+
+def run_benchmark(module_name, scene_name, quality, repeat):
+    runs = []
+    for _ in range(repeat):
+        # A fresh process per run keeps peak RSS and warm caches per scene
+        with ProcessPoolExecutor(max_workers=1, max_tasks_per_child=1) as pool:
+            runs.append(pool.submit(
+                render_scene, module_name, scene_name, quality, disable_caching=True
+            ).result())
+    best = min(runs, key=lambda r: r["wall_time"])
+    best["fps"] = best["frames"] / best["wall_time"] if best["wall_time"] else 0.0
+    return best
+
+
+def hash_benchmark(module_name, scene_name, quality):
+    from manim import tempconfig
+    from manim.utils.hashing import get_hash_from_play_call
+
+    from hashing import get_fast_hash_from_play_call
+
+    backends = {"json": get_hash_from_play_call, "blake2": get_fast_hash_from_play_call}
+    timings = dict.fromkeys(backends, 0.0)
+    scene_cls = load_scene(module_name, scene_name)
+    with tempconfig(scene_config(module_name, quality, write_to_movie=False, disable_caching=True)):
+        # Skipping still compiles and begins every play, but writes no frames
+        scene = scene_cls(skip_animations=True)
+        begin_animations = scene.begin_animations
+
+        def timed_begin():
+            # Same arguments and point in play() as the renderer's own hash call,
+            # which passes the scene (not the renderer) first
+            args = (scene, scene.camera, scene.animations, scene.mobjects)
+            for name, backend in backends.items():
+                start = time.perf_counter()
+                backend(*args)
+                timings[name] += time.perf_counter() - start
+            begin_animations()
+
+        scene.begin_animations = timed_begin
+        scene.render()
+    return {"plays": scene.renderer.num_plays, **timings}
+
+
+def run_hash_benchmarks(scenes, quality):
+    print(f"{'scene':<28} {'plays':>6} {'json_ms':>9} {'blake2_ms':>10} {'speedup':>8}")
+    for module_name, scene_name in scenes:
+        with ProcessPoolExecutor(max_workers=1, max_tasks_per_child=1) as pool:
+            result = pool.submit(hash_benchmark, module_name, scene_name, quality).result()
+        speedup = result["json"] / result["blake2"] if result["blake2"] else 0.0
+        print(
+            f"{scene_name:<28} {result['plays']:>6} {result['json'] * 1000:>9.1f} "
+            f"{result['blake2'] * 1000:>10.1f} {speedup:>7.1f}x"
+        )
+    return 0
+
+
+def compare(result, baseline, threshold):
+    regressions = []
+    for metric in COMPARED:
+        before = baseline.get(metric)
+        if not before:
+            continue
+        change = (result[metric] - before) / before * 100
+        if change > threshold:
+            regressions.append(f"{metric} +{change:.1f}%")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark scene rendering.")
+    parser.add_argument("-q", "--quality", default="l", choices=list("lmhpk"))
+    parser.add_argument("-s", "--scene", action="append", help="only these scene names")
+    parser.add_argument("-r", "--repeat", type=int, default=1, help="best of N runs")
+    parser.add_argument("--threshold", type=float, default=15.0,
+                        help="allowed regression in percent (default: 15)")
+    parser.add_argument("--baseline", type=Path, default=BASELINE)
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--no-micro", action="store_true", help="skip the synthetic scenes")
+    parser.add_argument("--hash", action="store_true", help="benchmark play() hashing instead")
+    args = parser.parse_args(argv)
+
+    scenes = discover_scenes() + ([] if args.no_micro else MICRO_SCENES)
+    if args.scene:
+        scenes = [s for s in scenes if s[1] in args.scene]
+    if args.hash:
+        return run_hash_benchmarks(scenes, args.quality)
+    baseline = json.loads(args.baseline.read_text()) if args.baseline.exists() else {}
+
+    results, failures = {}, []
+    print(f"{'scene':<28} {'frames':>7} {'fps':>7} {'time_s':>8} {'rss_mb':>8} {'cache_mb':>9}  vs baseline")
+    for module_name, scene_name in scenes:
+        result = run_benchmark(module_name, scene_name, args.quality, args.repeat)
+        results[scene_name] = {k: result[k] for k in ("frames", "fps", "wall_time", "peak_rss_mb", "cache_mb")}
+        regressions = compare(result, baseline.get(scene_name, {}), args.threshold)
+        if regressions:
+            failures.append(scene_name)
+        status = ", ".join(regressions) or ("ok" if scene_name in baseline else "no baseline")
+        print(
+            f"{scene_name:<28} {result['frames']:>7} {result['fps']:>7.1f} {result['wall_time']:>8.2f} "
+            f"{result['peak_rss_mb']:>8.1f} {result['cache_mb']:>9.2f}  {status}"
+        )
+
+    if args.save_baseline:
+        args.baseline.write_text(json.dumps({**baseline, **results}, indent=2) + "\n")
+        print(f"Saved baseline to {args.baseline.name}")
+        return 0
+    if failures:
+        print(f"Regressed past {args.threshold:g}%: {', '.join(failures)}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,100 @@
+# --- Synthetic microbenchmark scenes for bench.py ---
+# Each one isolates a pattern the explainers lean on, written the same
+# way the scenes write it.
+
+import random
+
+from manim import *
+
+from base_scene import ExplainerScene
+from fast_flash import FastFlash
+from glyph_rain import BinaryRain
+from mesh import FullMesh
+from particles import ParticleSystem
+
+
+class LargeFlashBench(ExplainerScene):
+    def construct(self):
+        target = Circle(radius=1.2, color=BLUE)
+        self.add(target)
+        for _ in range(4):
+            self.play(
+                Flash(target, color=BLUE, num_lines=120, line_length=0.8, flash_radius=1.5),
+                run_time=0.8
+            )
+
+
+class MeshWiggleBench(ExplainerScene):
+    def construct(self):
+        users = VGroup()
+        # SFUExplainer's 5-user mesh: the 10 lines it wiggles
+        for i in range(5):
+            angle = i * (2 * PI / 5) + PI/2
+            users.add(Circle(radius=0.2, color=BLUE).move_to([np.cos(angle)*2.5, np.sin(angle)*2.5, 0]))
+        lines = VGroup(*[
+            Line(users[i].get_center(), users[j].get_center(), color=PINK).set_stroke(width=2, opacity=0.6)
+            for i in range(len(users)) for j in range(i + 1, len(users))
+        ])
+        self.add(users, lines)
+        for _ in range(4):
+            self.play(
+                *[line.animate.put_start_and_end_on(
+                    line.get_start() + np.random.randn(3)*0.05,
+                    line.get_end() + np.random.randn(3)*0.05
+                ) for line in lines],
+                run_time=0.5,
+                rate_func=there_and_back
+            )
+
+
+class ParticleBurstBench(ExplainerScene):
+    def construct(self):
+        particles = VGroup(*[
+            Circle(radius=0.1, color=random.choice([PINK, TEAL]), fill_opacity=0.9, stroke_width=0)
+            for _ in range(100)
+        ])
+        self.add(particles)
+        self.play(
+            *[p.animate.shift([np.random.uniform(-5, 5), np.random.uniform(-5, 5), 0]).set_opacity(0)
+              for p in particles],
+            run_time=1.5,
+            rate_func=rush_from
+        )
+
+
+class ParticleSystemBurstBench(ExplainerScene):
+    def construct(self):
+        particles = ParticleSystem.scattered(
+            10_000, colors=[PINK, TEAL], x_range=(0, 0), y_range=(0, 0), speed=5,
+            radius=0.05, opacity=0.9
+        )
+        self.add(particles)
+        self.play(particles.burst(), run_time=1.5, rate_func=rush_from)
+
+
+class BinaryRainBench(ExplainerScene):
+    def construct(self):
+        rain = BinaryRain(columns=200, rows=30, font="Courier New", color="#06ffa5", font_size=20, opacity=0.4)
+        self.add(rain.start())
+        self.wait(2)
+
+
+class FullMeshJitterBench(ExplainerScene):
+    def construct(self):
+        angles = np.linspace(0, TAU, 200, endpoint=False)
+        nodes = np.column_stack([np.cos(angles) * 2.5, np.sin(angles) * 2.5, np.zeros(200)])
+        mesh = FullMesh(nodes, color=PINK).set_stroke(width=2, opacity=0.6)
+        self.add(mesh)
+        for _ in range(4):
+            self.play(mesh.jitter(amplitude=0.05), run_time=0.5, rate_func=there_and_back)
+
+
+class LargeFastFlashBench(ExplainerScene):
+    def construct(self):
+        target = Circle(radius=1.2, color=BLUE)
+        self.add(target)
+        for _ in range(4):
+            self.play(
+                FastFlash(target, color=BLUE, num_lines=120, line_length=0.8, flash_radius=1.5),
+                run_time=0.8
+            )
@@ -0,0 +1,147 @@
+# --- Compilation video ---
+# Joins the rendered explainers back to back with a stream copy, so
+# nothing is decoded or re-encoded. Every segment is probed first. A
+# segment whose codec, size, pixel format, frame rate or timescale differs
+# from the majority is re-encoded once to match (cached under
+# media/compilation). Optional title cards are rendered once per
+# title/quality and cached the same way.
+#
+#   python compile_video.py -q h --titles
+#   python compile_video.py -s WebRTCExplainerVibrant -s SFUExplainer -o webrtc.mp4
+
+import argparse
+import hashlib
+import re
+import shutil
+import sys
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from manim import *
+
+from base_scene import ExplainerScene
+from render_all import MEDIA_DIR, discover_scenes, quality_config, render_scene, scene_config
+from text_cache import cached_text
+from video_io import CONCAT_KEYS, concat_movies, probe_video, reencode_like
+
+CACHE_DIR = MEDIA_DIR / "compilation"
+CARD_SECONDS = 2.0
+# Bump when TitleCard's look changes, so cached cards are rebuilt
+CARD_STYLE = 1
+
+
+class TitleCard(ExplainerScene):
+    # A tool scene, not one of the explainers
+    in_catalog = False
+    title = ""
+
+    def construct(self):
+        self.camera.background_color = "#0F172A"
+        title = cached_text(self.title, font="Inter", weight=BOLD, font_size=56, color="#F8FAFC")
+        self.play(FadeIn(title, shift=UP * 0.2), run_time=0.5)
+        self.wait(CARD_SECONDS - 1.0)
+        self.play(FadeOut(title), run_time=0.5)
+
+
+def card_title(scene_name):
+    return re.sub(r"(?<=[a-z])(?=[A-Z])", " ", scene_name)
+
+
+def scene_output(module_name, scene_name, quality):
+    q = quality_config(quality)
+    return MEDIA_DIR / "videos" / module_name / f"{q['pixel_height']}p{q['frame_rate']}" / f"{scene_name}.mp4"
+
+
+def render_card(title, quality, path):
+    card = type("TitleCard", (TitleCard,), {"title": title})
+    overrides = {
+        "output_file": path.stem,
+        "disable_caching": True,
+        # Cards render side by side, so keep their partial movies apart
+        "partial_movie_dir": "{video_dir}/partial_movie_files/" + path.stem,
+    }
+    with tempconfig(scene_config("compile_video", quality, **overrides)):
+        scene = card()
+        scene.render()
+        shutil.copyfile(scene.renderer.file_writer.movie_file_path, path)
+    return path
+
+
+def title_cards(titles, quality, jobs):
+    key = repr((CARD_STYLE, quality_config(quality)))
+    paths = {
+        title: CACHE_DIR / "cards" / f"{hashlib.sha1((key + title).encode()).hexdigest()[:16]}.mp4"
+        for title in titles
+    }
+    missing = [title for title, path in paths.items() if not path.exists()]
+    if missing:
+        paths[missing[0]].parent.mkdir(parents=True, exist_ok=True)
+        with ProcessPoolExecutor(max_workers=min(jobs, len(missing)), max_tasks_per_child=1) as pool:
+            for future in [pool.submit(render_card, title, quality, paths[title]) for title in missing]:
+                future.result()
+    print(f"Title cards: {len(titles) - len(missing)} cached, {len(missing)} rendered")
+    return paths
+
+
+def normalize(segments):
+    # The most common parameter set wins; everything else is re-encoded to it
+    probes = {path: probe_video(path) for path in segments}
+    counts = Counter(tuple(p[k] for k in CONCAT_KEYS) for p in probes.values())
+    reference = dict(zip(CONCAT_KEYS, counts.most_common(1)[0][0]))
+
+    joined = []
+    for path in segments:
+        if probes[path] == reference:
+            joined.append(path)
+            continue
+        digest = hashlib.sha1(repr((str(path.resolve()), path.stat().st_mtime_ns, reference)).encode())
+        fixed = CACHE_DIR / "normalized" / f"{path.stem}_{digest.hexdigest()[:12]}.mp4"
+        if not fixed.exists():
+            fixed.parent.mkdir(parents=True, exist_ok=True)
+            differs = ", ".join(k for k in CONCAT_KEYS if probes[path][k] != reference[k])
+            print(f"Re-encoding {path.name} ({differs} differ)")
+            reencode_like(path, fixed, reference)
+        joined.append(fixed)
+    return joined
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Join rendered scenes into one video without re-encoding.")
+    parser.add_argument("-q", "--quality", default="h", choices=list("lmhpk"))
+    parser.add_argument("-s", "--scene", action="append", help="scenes to include, in order (default: all)")
+    parser.add_argument("-o", "--output", type=Path, default=MEDIA_DIR / "compilation.mp4")
+    parser.add_argument("--titles", action="store_true", help="put a title card before each scene")
+    parser.add_argument("--render-missing", action="store_true", help="render scenes that have no output yet")
+    parser.add_argument("-j", "--jobs", type=int, default=4)
+    args = parser.parse_args(argv)
+
+    scenes = {name: module for module, name in discover_scenes()}
+    order = args.scene or list(scenes)
+    unknown = [name for name in order if name not in scenes]
+    if unknown:
+        parser.error(f"unknown scene(s): {', '.join(unknown)}")
+
+    outputs = {name: scene_output(scenes[name], name, args.quality) for name in order}
+    missing = [name for name, path in outputs.items() if not path.exists()]
+    if missing and not args.render_missing:
+        parser.error(f"not rendered at -q {args.quality}: {', '.join(missing)} (use --render-missing)")
+    for name in missing:
+        with ProcessPoolExecutor(max_workers=1, max_tasks_per_child=1) as pool:
+            outputs[name] = Path(pool.submit(render_scene, scenes[name], name, args.quality).result()["output"])
+
+    segments = []
+    cards = title_cards([card_title(name) for name in order], args.quality, args.jobs) if args.titles else {}
+    for name in order:
+        if cards:
+            segments.append(cards[card_title(name)])
+        segments.append(outputs[name])
+
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    concat_movies(normalize(segments), args.output)
+    print(f"Wrote {args.output} ({len(order)} scenes{', with title cards' if cards else ''})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
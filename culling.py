@@ -0,0 +1,103 @@
+# --- Invisible and off-frame culling ---
+# Before drawing, the camera drops mobjects that are fully transparent or
+# whose bounding box misses the frame. For stroke-only VMobjects it also
+# drops individual curves whose control points all lie outside the frame.
+# A Bezier curve stays inside the hull of its control points, so this
+# never changes a pixel. Filled shapes are always drawn whole, because
+# cutting their outline would change the fill.
+#
+# RENDER_CULL=0 turns culling off, for A/B checks.
+
+import os
+
+import numpy as np
+from manim import VMobject
+
+# Slack around the frame, in scene units; covers stroke half-widths
+# (width 10 is 0.05 units) with room to spare
+CULL_MARGIN = 0.25
+
+
+def culling_enabled():
+    return os.environ.get("RENDER_CULL", "1").lower() not in ("0", "off", "false")
+
+
+def is_transparent(mob):
+    if isinstance(mob, VMobject):
+        strokes = (
+            (mob.get_stroke_opacities(), mob.get_stroke_width()),
+            (mob.get_stroke_opacities(background=True), mob.get_stroke_width(background=True)),
+        )
+        return not np.any(mob.get_fill_opacities()) and not any(
+            width > 0 and np.any(opacities) for opacities, width in strokes
+        )
+    rgbas = getattr(mob, "rgbas", None)
+    if rgbas is not None and len(rgbas):
+        return not np.any(rgbas[:, 3])
+    # Images and anything else are left to the camera
+    return False
+
+
+def cull_margin(mob):
+    # Glows and particle radii reach past the points themselves
+    margin = CULL_MARGIN
+    glow = getattr(mob, "glow", None)
+    if glow is not None:
+        margin += 3 * glow[0]
+    radii = getattr(mob, "radii", None)
+    if radii is not None and len(radii):
+        margin += radii.max()
+    return margin
+
+
+class CullingCameraMixin:
+    def __init__(self, *args, cull=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.cull = culling_enabled() if cull is None else cull
+        self.cull_stats = {"mobjects": 0, "points": 0, "curves": 0}
+
+    def frame_bounds(self, margin):
+        x, y = self.frame_center[:2]
+        half_w, half_h = self.frame_width / 2 + margin, self.frame_height / 2 + margin
+        return np.array([x - half_w, y - half_h]), np.array([x + half_w, y + half_h])
+
+    def get_mobjects_to_display(self, *args, **kwargs):
+        mobjects = super().get_mobjects_to_display(*args, **kwargs)
+        if not self.cull:
+            return mobjects
+        visible = []
+        for mob in mobjects:
+            points = mob.points
+            low, high = self.frame_bounds(cull_margin(mob))
+            if is_transparent(mob) or (
+                np.all(np.isfinite(points))
+                and (np.any(points[:, :2].max(axis=0) < low) or np.any(points[:, :2].min(axis=0) > high))
+            ):
+                self.cull_stats["mobjects"] += 1
+                self.cull_stats["points"] += len(points)
+                continue
+            visible.append(mob)
+        return visible
+
+    def transform_points_pre_display(self, mobject, points):
+        points = super().transform_points_pre_display(mobject, points)
+        if (
+            not self.cull
+            or not isinstance(mobject, VMobject)
+            or len(points) < 8
+            or len(points) % 4
+            or np.any(mobject.get_fill_opacities())
+        ):
+            return points
+        curves = points.reshape(-1, 4, 3)
+        low, high = self.frame_bounds(cull_margin(mobject))
+        outside = np.any(curves[:, :, :2].max(axis=1) < low, axis=1) | np.any(
+            curves[:, :, :2].min(axis=1) > high, axis=1
+        )
+        if not outside.any():
+            return points
+        # Keep one curve so Cairo still gets a fresh path to stroke
+        keep = ~outside if not outside.all() else np.arange(len(curves)) == 0
+        self.cull_stats["curves"] += int(len(curves) - keep.sum())
+        self.cull_stats["points"] += int(4 * (len(curves) - keep.sum()))
+        return curves[keep].reshape(-1, 3)
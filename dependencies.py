@@ -0,0 +1,179 @@
+# --- Per-step dependency tracking ---
+# RENDER_DEPS=1 records, for every play(), which top-level mobjects the
+# step reads and which ones it writes. A step reads what is on stage with
+# points plus anything it animates or that carries updaters. It writes
+# whatever looks different once the step is over. The partial-movie hash
+# is built from the reads alone, so an edit only invalidates the steps
+# that draw or animate the edited mobject. Removed state no longer spills
+# into every later segment. The read set bypasses the camera's culling so
+# tracking never adds to its cull stats.
+#
+# At tear-down media/deps/<Scene>.json lists each step as reused, rebuilt
+# or skipped. Rebuilt steps name the inputs that changed since the previous
+# run, and the earlier step that wrote each of them.
+
+import hashlib
+import json
+import os
+from collections import Counter
+from pathlib import Path
+
+from manim import config, logger
+from manim.utils.family import extract_mobject_family_members
+
+from hashing import CAMERA_ATTRS, animation_digest, update_digest
+from layered_camera import mobject_fingerprint
+
+
+def dependencies_enabled():
+    return os.environ.get("RENDER_DEPS", "0").lower() in ("1", "on", "true")
+
+
+def dependency_hash(scene, camera, animations, mobjects):
+    # Installed in place of manim's hash, which CairoRenderer.play calls with
+    # the scene first, so it dispatches to whichever scene is playing
+    return scene._dependency_hash(camera, animations, mobjects)
+
+
+def family_fingerprint(mob, members=None):
+    h = hashlib.blake2b(digest_size=16)
+    for member in mob.family_members_with_points():
+        if members is None or id(member) in members:
+            h.update(mobject_fingerprint(member))
+    return h.hexdigest()
+
+
+class DependencyMixin:
+    def setup(self):
+        super().setup()
+        self.dependencies = None
+        if dependencies_enabled():
+            self._install_dependency_tracking()
+
+    def _install_dependency_tracking(self):
+        import manim.renderer.cairo_renderer as cairo_renderer
+
+        self.dependencies = []
+        self._labels = {}
+        self._label_counts = Counter()
+        self._step = None
+        # Replaces FAST_HASH's hash too, since this one is computed from the
+        # reads; tear_down() puts back whatever was installed before
+        self._previous_hash = cairo_renderer.get_hash_from_play_call
+        cairo_renderer.get_hash_from_play_call = dependency_hash
+        self.play = self._tracked_play(self.play)
+
+    def mobject_label(self, mob):
+        # Stable across runs as long as the construction order is: texts by
+        # content, everything else by type, each numbered by occurrence
+        entry = self._labels.get(id(mob))
+        if entry is None:
+            text = getattr(mob, "original_text", None)
+            base = f"{type(mob).__name__}({text!r})" if isinstance(text, str) else type(mob).__name__
+            count = self._label_counts[base]
+            self._label_counts[base] += 1
+            # The mobject is kept alive so its id can't be reused
+            entry = self._labels[id(mob)] = (mob, f"{base}#{count}" if count else base)
+        return entry[1]
+
+    def _stage_fingerprints(self):
+        return {self.mobject_label(mob): family_fingerprint(mob) for mob in self.mobjects}
+
+    def _tracked_play(self, play):
+        def wrapper(*args, **kwargs):
+            before = self._stage_fingerprints()
+            self._step = {"index": self.renderer.num_plays, "hash": None, "reused": None, "reads": {}}
+            try:
+                return play(*args, **kwargs)
+            finally:
+                after = self._stage_fingerprints()
+                self._step["animations"] = [type(a).__name__ for a in (getattr(self, "animations", None) or [])]
+                self._step["writes"] = sorted(
+                    label for label in before.keys() | after.keys() if before.get(label) != after.get(label)
+                )
+                self.dependencies.append(self._step)
+
+        return wrapper
+
+    def _read_set(self, animations, mobjects):
+        members = {id(m) for m in extract_mobject_family_members(mobjects, only_those_with_points=True)}
+        tops = list(mobjects)
+        for animation in animations:
+            mob = getattr(animation, "mobject", None)
+            if mob is None:
+                continue
+            members.update(id(m) for m in mob.get_family())
+            # Introducers (FadeIn, Create, ...) join the scene after the hash
+            if mob not in tops:
+                tops.append(mob)
+        for top in tops:
+            for mob in top.get_family():
+                if mob.updaters:
+                    members.update(id(m) for m in mob.get_family())
+
+        reads = {}
+        for top in tops:
+            if any(id(m) in members for m in top.get_family()):
+                reads[self.mobject_label(top)] = family_fingerprint(top, members)
+        return reads
+
+    def _dependency_hash(self, camera, animations, mobjects):
+        reads = self._read_set(animations, mobjects)
+        h = hashlib.blake2b(digest_size=16)
+        for attr in CAMERA_ATTRS:
+            update_digest(h, getattr(camera, attr, None))
+        for animation in animations:
+            animation_digest(h, animation)
+        # Fingerprints only, in draw order; labels would tie the hash to numbering
+        for fingerprint in reads.values():
+            h.update(fingerprint.encode())
+        key = h.hexdigest()
+
+        self._step.update(hash=key, reused=self.renderer.file_writer.is_already_cached(key), reads=reads)
+        return key
+
+    def tear_down(self):
+        super().tear_down()
+        if self.dependencies is not None:
+            import manim.renderer.cairo_renderer as cairo_renderer
+
+            # Render-daemon workers run many scenes in one process
+            cairo_renderer.get_hash_from_play_call = self._previous_hash
+            self.write_dependency_report()
+
+    def write_dependency_report(self):
+        name = type(self).__name__
+        out_dir = Path(config.media_dir) / "deps"
+        out_dir.mkdir(parents=True, exist_ok=True)
+        path = out_dir / f"{name}.json"
+        previous = {}
+        if path.exists():
+            previous = {s["index"]: s for s in json.loads(path.read_text())["steps"]}
+
+        last_writer = {}
+        for step in self.dependencies:
+            if step["hash"] is None:
+                step["status"] = "skipped"
+            elif step["reused"]:
+                step["status"] = "reused"
+            else:
+                step["status"] = "rebuilt"
+                before = previous.get(step["index"], {}).get("reads", {})
+                step["changed"] = [
+                    {"mobject": label, "written_in": last_writer.get(label)}
+                    for label in sorted(before.keys() | step["reads"].keys())
+                    if before.get(label) != step["reads"].get(label)
+                ]
+            last_writer.update(dict.fromkeys(step["writes"], step["index"]))
+
+        path.write_text(json.dumps({"scene": name, "steps": self.dependencies}, indent=2))
+        counts = Counter(step["status"] for step in self.dependencies)
+        rebuilt = [
+            f"#{s['index']} ({', '.join(c['mobject'] for c in s['changed'][:3]) or 'no previous run'})"
+            for s in self.dependencies if s["status"] == "rebuilt"
+        ]
+        logger.info(
+            f"Dependencies: {counts['reused']} reused, {counts['rebuilt']} rebuilt, "
+            f"{counts['skipped']} skipped; report in {path}"
+            + (f"; rebuilt {', '.join(rebuilt[:10])}" if rebuilt else "")
+        )
@@ -0,0 +1,59 @@
+# --- Deterministic randomness ---
+# Seeds Python's and NumPy's global RNGs from the scene name and the index
+# of the next play(), so every step draws the same numbers on every run
+# (and in every render_chunks worker). Identical inputs give identical
+# play() hashes, which is what lets manim reuse its partial movies.
+#
+# RENDER_SEED=<n> picks another base seed, RENDER_SEED=off restores
+# unseeded behaviour.
+
+import os
+import random
+import zlib
+
+import numpy as np
+
+SEED_ENV = "RENDER_SEED"
+
+
+def base_seed():
+    value = os.environ.get(SEED_ENV, "0").strip().lower()
+    if value in ("off", "none", "random"):
+        return None
+    return int(value)
+
+
+def seed_for(scene_name, play_index, base=0):
+    return zlib.crc32(f"{base}:{scene_name}:{play_index}".encode())
+
+
+def seed_everything(seed):
+    random.seed(seed)
+    np.random.seed(seed)
+
+
+class DeterministicMixin:
+    def setup(self):
+        super().setup()
+        self._base_seed = base_seed()
+        self._reseed(0)
+
+    def play(self, *args, **kwargs):
+        super().play(*args, **kwargs)
+        # Whatever is built between this play() and the next one draws
+        # from the next step's stream, so editing one step leaves the
+        # random values of every other step alone.
+        self._reseed(self.renderer.num_plays)
+
+    def _reseed(self, play_index):
+        if self._base_seed is None:
+            return
+        seed_everything(seed_for(self._seed_name(), play_index, self._base_seed))
+
+    def _seed_name(self):
+        # The class that defines construct(), so tool subclasses (timeline
+        # probes, storyboards) draw the same numbers as the real scene
+        for cls in type(self).__mro__:
+            if "construct" in vars(cls):
+                return cls.__name__
+        return type(self).__name__
@@ -0,0 +1,231 @@
+# --- Pipelined frame encoding ---
+# FRAME_PIPELINE=1 moves video encoding into its own process, so Cairo can
+# rasterize frame N+1 while frame N is being encoded. Frames live in a
+# shared-memory ring: the camera draws straight into a ring slot, and the
+# writer only sends the slot index, so nothing is copied. When every slot
+# is taken, the renderer blocks until the encoder frees one (backpressure).
+#
+# A hold (wait() with nothing moving) is sent as a repeat of the slot the
+# encoder already has, and the encoder re-encodes it without new pixels.
+# Stall and idle statistics are logged when the scene finishes.
+#
+# Only the default H.264 .mp4 output is pipelined; other formats fall back
+# to manim's own writer. FRAME_RING_SLOTS sets the ring size (default 6).
+
+import multiprocessing as mp
+import os
+import queue
+import time
+from fractions import Fraction
+from multiprocessing.shared_memory import SharedMemory
+
+import numpy as np
+from manim import config, logger
+from manim.renderer.cairo_renderer import CairoRenderer
+from manim.scene.scene_file_writer import SceneFileWriter
+from manim.utils.file_ops import write_to_movie
+
+
+def pipeline_enabled():
+    if os.environ.get("FRAME_PIPELINE", "0").lower() not in ("1", "on", "true"):
+        return False
+    return config.movie_file_extension == ".mp4" and not config.transparent
+
+
+def ring_slots():
+    # One slot being drawn, one held by the encoder for repeats, the rest queued
+    return max(3, int(os.environ.get("FRAME_RING_SLOTS", "6")))
+
+
+def encode_frames(shm_name, shape, slots, messages, free_slots, stats, frame_rate):
+    import av
+
+    shm = SharedMemory(name=shm_name)
+    frames = np.ndarray((slots, *shape), dtype=np.uint8, buffer=shm.buf)
+    container = stream = held = None
+    idle, encoded, repeats = 0.0, 0, 0
+    while True:
+        start = time.perf_counter()
+        message = messages.get()
+        idle += time.perf_counter() - start
+        if message is None:
+            break
+        kind = message[0]
+        if kind == "open":
+            # Same settings as SceneFileWriter.open_partial_movie_stream
+            container = av.open(message[1], mode="w")
+            stream = container.add_stream("libx264", rate=frame_rate, options={"an": "1", "crf": "23"})
+            stream.pix_fmt = "yuv420p"
+            stream.height, stream.width = shape[:2]
+        elif kind == "frame":
+            _, slot, num_frames = message
+            if slot == held:
+                repeats += num_frames
+            else:
+                # The previous slot can't be repeated any more, so hand it back
+                if held is not None:
+                    free_slots.put(held)
+                held = slot
+                repeats += num_frames - 1
+            for _ in range(num_frames):
+                # A fresh VideoFrame per encode; PyAV garbles reused ones
+                av_frame = av.VideoFrame.from_ndarray(frames[slot], format="rgba")
+                for packet in stream.encode(av_frame):
+                    container.mux(packet)
+            encoded += num_frames
+        elif kind == "close":
+            for packet in stream.encode():
+                container.mux(packet)
+            container.close()
+            container = stream = None
+
+    if held is not None:
+        free_slots.put(held)
+    stats.put({"encoded": encoded, "repeats": repeats, "encoder_idle": idle})
+    del frames
+    shm.close()
+
+
+class PipelinedFileWriter(SceneFileWriter):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.encoder = None
+        self.stall_count = 0
+        self.stall_time = 0.0
+
+    def start_pipeline(self):
+        shape = (config.pixel_height, config.pixel_width, 4)
+        slots = ring_slots()
+        self.shm = SharedMemory(create=True, size=slots * int(np.prod(shape)))
+        # Fixed array objects per slot: Cairo contexts are cached by array id
+        frames = np.ndarray((slots, *shape), dtype=np.uint8, buffer=self.shm.buf)
+        self.frames = [frames[i] for i in range(slots)]
+        self.sent = set()
+        self.last_sent = None
+
+        context = mp.get_context("fork")
+        self.messages = context.Queue()
+        self.free_slots = context.Queue()
+        self.stats = context.Queue()
+        for slot in range(slots):
+            self.free_slots.put(slot)
+        self.encoder = context.Process(
+            target=encode_frames,
+            args=(self.shm.name, shape, slots, self.messages, self.free_slots, self.stats,
+                  Fraction(config.frame_rate).limit_denominator()),
+            daemon=True,
+        )
+        self.encoder.start()
+
+    def slot_of(self, frame):
+        for slot, array in enumerate(self.frames):
+            if frame is array:
+                return slot
+        return None
+
+    def from_encoder(self, channel):
+        # Blocking get that fails instead of hanging if the encoder died
+        while True:
+            try:
+                return channel.get(timeout=1.0)
+            except queue.Empty:
+                if not self.encoder.is_alive():
+                    raise RuntimeError(f"Encoder process exited with code {self.encoder.exitcode}")
+
+    def acquire_slot(self):
+        try:
+            slot = self.free_slots.get_nowait()
+        except queue.Empty:
+            start = time.perf_counter()
+            slot = self.from_encoder(self.free_slots)
+            self.stall_count += 1
+            self.stall_time += time.perf_counter() - start
+        self.sent.discard(slot)
+        return slot
+
+    def prepare_frame(self, camera):
+        # Called before every rasterization: draw into a slot the encoder
+        # hasn't been given yet
+        if self.encoder is None:
+            return
+        slot = self.slot_of(camera.pixel_array)
+        if slot is None or slot in self.sent:
+            camera.pixel_array = self.frames[self.acquire_slot()]
+
+    def open_partial_movie_stream(self, file_path=None):
+        if self.encoder is None:
+            self.start_pipeline()
+        if file_path is None:
+            file_path = self.partial_movie_files[self.renderer.num_plays]
+        self.partial_movie_file_path = file_path
+        self.messages.put(("open", str(file_path)))
+
+    def close_partial_movie_stream(self):
+        self.messages.put(("close",))
+        logger.info(
+            f"Animation {self.renderer.num_plays} : Partial movie file queued for {self.partial_movie_file_path}"
+        )
+
+    def write_frame(self, frame, num_frames=1):
+        if not write_to_movie() or self.encoder is None:
+            return super().write_frame(frame, num_frames)
+        slot = self.slot_of(frame)
+        if slot is None:
+            # A frame that isn't in the ring (e.g. a saved static image)
+            slot = self.acquire_slot()
+            self.frames[slot][:] = frame
+        self.messages.put(("frame", slot, num_frames))
+        self.sent.add(slot)
+        self.last_sent = slot
+
+    def stop_pipeline(self):
+        if self.encoder is None:
+            return
+        self.messages.put(None)
+        stats = self.from_encoder(self.stats)
+        self.encoder.join()
+        self.encoder = None
+
+        # Let go of every view into the ring before releasing it
+        camera = self.renderer.camera
+        if self.slot_of(camera.pixel_array) is not None:
+            camera.pixel_array = camera.pixel_array.copy()
+        for array in self.frames:
+            camera.pixel_array_to_cairo_context.pop(id(array), None)
+        self.frames = []
+        try:
+            self.shm.close()
+        except BufferError:
+            # Still referenced somewhere; the mapping goes away with the process
+            pass
+        self.shm.unlink()
+
+        logger.info(
+            f"Frame pipeline: {stats['encoded']} frames encoded ({stats['repeats']} repeats), "
+            f"renderer stalled {self.stall_count}x for {self.stall_time:.2f}s, "
+            f"encoder idle {stats['encoder_idle']:.2f}s"
+        )
+
+    def finish(self):
+        # Partial movies must be complete before they are combined
+        self.stop_pipeline()
+        super().finish()
+
+
+class PipelinedRenderer(CairoRenderer):
+    def __init__(self, file_writer_class=PipelinedFileWriter, **kwargs):
+        super().__init__(file_writer_class=file_writer_class, **kwargs)
+
+    def update_frame(self, *args, **kwargs):
+        self.file_writer.prepare_frame(self.camera)
+        super().update_frame(*args, **kwargs)
+
+    def render(self, scene, time, moving_mobjects):
+        # Hand over the slot itself instead of get_frame()'s copy
+        self.update_frame(scene, moving_mobjects)
+        self.add_frame(self.camera.pixel_array)
+
+    def freeze_current_frame(self, duration):
+        # The encoder still holds this slot, so a hold becomes a repeat
+        dt = 1 / self.camera.frame_rate
+        self.add_frame(self.camera.pixel_array, num_frames=int(duration / dt))
@@ -0,0 +1,64 @@
+# --- Glyph atlas ---
+# Lays out a fixed alphabet once per (font, size, weight) and keeps one
+# outline per character, positioned relative to its own cell. Mobjects that
+# show many characters from a small alphabet copy these outlines instead of
+# running Pango and SVG parsing for every string.
+
+from manim import *
+
+from text_cache import cached_text
+
+DIGITS = "0123456789"
+
+
+class GlyphAtlas:
+    _atlases = {}
+
+    @classmethod
+    def get(cls, alphabet, **text_kwargs):
+        key = (alphabet, tuple(sorted((k, repr(v)) for k, v in text_kwargs.items())))
+        atlas = cls._atlases.get(key)
+        if atlas is None:
+            atlas = cls._atlases[key] = cls(alphabet, **text_kwargs)
+            atlas.key = key
+        return atlas
+
+    @classmethod
+    def lookup(cls, key):
+        return cls._atlases[key]
+
+    def __init__(self, alphabet, **text_kwargs):
+        if any(ch.isspace() for ch in alphabet) or len(set(alphabet)) != len(alphabet):
+            raise ValueError("Atlas alphabet must be unique, non-whitespace characters")
+        text = cached_text(alphabet, **text_kwargs)
+        if len(text.submobjects) != len(alphabet):
+            raise ValueError(f"Font produced {len(text.submobjects)} glyphs for {len(alphabet)} characters")
+
+        self.key = None
+        self.alphabet = alphabet
+        self.height = text.height
+        # Glyph outlines keep their height relative to the line, so digits
+        # placed at the same cell center share a baseline
+        line_center_y = text.get_center()[1]
+        self.glyphs = {}
+        for ch, glyph in zip(alphabet, text.submobjects):
+            glyph = glyph.copy()
+            glyph.shift([-glyph.get_center()[0], -line_center_y, 0])
+            self.glyphs[ch] = glyph
+        self.cell_width = max(g.width for g in self.glyphs.values()) + 0.08 * self.height
+
+        # Every outline padded to the same point count by repeating its last
+        # anchor (zero-length curves draw nothing), so strings can be laid out
+        # with one fancy-indexing op: outlines[codes] + offsets
+        longest = max(len(g.points) for g in self.glyphs.values())
+        self.outlines = np.array([
+            np.vstack([g.points, np.repeat(g.points[-1:], longest - len(g.points), axis=0)])
+            for g in (self.glyphs[ch] for ch in alphabet)
+        ])
+        self.codes = {ch: i for i, ch in enumerate(alphabet)}
+
+    def glyph(self, ch):
+        return self.glyphs[ch].copy()
+
+    def encode(self, strings):
+        return np.array([self.codes[ch] for string in strings for ch in string], dtype=np.intp)
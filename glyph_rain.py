@@ -0,0 +1,113 @@
+# --- Glyph-atlas text fields and binary rain ---
+# GlyphField draws many short strings from a fixed alphabet as one
+# VMobject. Layout copies pre-built outlines from a GlyphAtlas with a single
+# indexing op, so re-laying out thousands of characters per frame costs a
+# few array operations and no Pango calls. BinaryRain builds on it for a
+# Matrix-style backdrop of scrolling, flickering columns.
+
+from manim import *
+
+from glyph_atlas import GlyphAtlas
+
+
+class GlyphField(VMobject):
+    def __init__(
+        self,
+        strings,
+        positions,
+        alphabet="01",
+        font="Courier New",
+        font_size=20,
+        color=WHITE,
+        opacity=1.0,
+        **kwargs,
+    ):
+        super().__init__(**kwargs)
+        atlas = GlyphAtlas.get(alphabet, font=font, font_size=font_size)
+        self.atlas_key = atlas.key
+        self.anchors = np.array(positions, dtype=float).reshape(-1, 3)
+        self.set_fill(color, opacity=opacity).set_stroke(width=0)
+        self.set_strings(strings)
+
+    @classmethod
+    def random_strings(cls, n, length=3, alphabet="01", x_range=(-5, 5), y_range=(-3, 4), **kwargs):
+        # Uses the global NumPy RNG, so DeterministicMixin seeding applies
+        codes = np.random.randint(0, len(alphabet), (n, length))
+        strings = ["".join(alphabet[c] for c in row) for row in codes]
+        positions = np.zeros((n, 3))
+        positions[:, 0] = np.random.uniform(*x_range, n)
+        positions[:, 1] = np.random.uniform(*y_range, n)
+        return cls(strings, positions, alphabet=alphabet, **kwargs)
+
+    @property
+    def atlas(self):
+        return GlyphAtlas.lookup(self.atlas_key)
+
+    def set_strings(self, strings):
+        self.strings = list(strings)
+        lengths = np.array([len(s) for s in self.strings])
+        owner = np.repeat(np.arange(len(lengths)), lengths)
+        column = np.arange(lengths.sum()) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+        # Each string is centered on its anchor, like Text(...).move_to(anchor)
+        offsets = self.anchors[owner].copy()
+        offsets[:, 0] += (column - (lengths[owner] - 1) / 2) * self.atlas.cell_width
+        self.set_glyphs(self.atlas.encode(self.strings), offsets)
+        return self
+
+    def set_glyphs(self, codes, offsets):
+        # Keeps any shift applied since the last layout
+        moved = self.points[0] - self._laid_out_first if len(self.points) else 0
+        points = (self.atlas.outlines[codes] + offsets[:, None, :]).reshape(-1, 3)
+        self._laid_out_first = points[0].copy()
+        self.points = points + moved
+        return self
+
+
+class BinaryRain(GlyphField):
+    def __init__(
+        self,
+        columns=40,
+        rows=18,
+        x_range=(-7, 7),
+        y_range=(-4, 4),
+        speed_range=(0.5, 2.0),
+        flip_rate=2.0,
+        alphabet="01",
+        **kwargs,
+    ):
+        # Own generator seeded from the global one, so DeterministicMixin applies
+        self.rng = np.random.default_rng(np.random.randint(0, 2**31))
+        self.flip_rate = flip_rate
+        self.y_range = y_range
+        self.rows = rows
+        self.row_height = (y_range[1] - y_range[0]) / rows
+        self.column_x = np.linspace(*x_range, columns)
+        self.speeds = self.rng.uniform(*speed_range, columns)
+        self.heads = self.rng.uniform(0, y_range[1] - y_range[0], columns)
+        self.codes = self.rng.integers(0, len(alphabet), (columns, rows))
+
+        positions = np.zeros((columns, 3))
+        positions[:, 0] = self.column_x
+        super().__init__([alphabet[0]] * columns, positions, alphabet=alphabet, **kwargs)
+        self.relayout()
+
+    def relayout(self):
+        columns, rows = self.codes.shape
+        span = self.y_range[1] - self.y_range[0]
+        y = self.y_range[1] - np.mod(
+            self.heads[:, None] + np.arange(rows)[None, :] * self.row_height, span
+        )
+        offsets = np.zeros((columns * rows, 3))
+        offsets[:, 0] = np.repeat(self.column_x, rows)
+        offsets[:, 1] = y.ravel()
+        return self.set_glyphs(self.codes.ravel(), offsets)
+
+    def advance(self, dt):
+        self.heads += self.speeds * dt
+        flips = self.rng.random(self.codes.shape) < self.flip_rate * dt
+        self.codes[flips] = self.rng.integers(0, len(self.atlas.alphabet), flips.sum())
+        return self.relayout()
+
+    def start(self):
+        self.add_updater(lambda mob, dt: mob.advance(dt))
+        return self
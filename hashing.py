@@ -0,0 +1,147 @@
+# --- Fast play() hashing ---
+# manim names each partial movie after a hash of the camera, the play()'s
+# animations and every mobject on stage, built by serializing all of them
+# to JSON. FAST_HASH=1 swaps in a blake2b hash over the raw NumPy memory of
+# points and style arrays instead (the same fingerprint the layered camera
+# uses). Function bytecode, which the JSON path re-reads via inspect on
+# every play, is digested once per code object and memoized. What a
+# function reads is digested on every play, like manim's getclosurevars:
+# closure cells, the module globals it names, and a bound method's
+# instance. Modules and classes are digested by name only.
+#
+# The hash format differs from manim's, so switching backends re-renders
+# once; after that the cache behaves as before.
+
+import hashlib
+import os
+import types
+
+import numpy as np
+from manim import Mobject
+from manim.animation.animation import Animation
+
+from layered_camera import mobject_fingerprint
+
+CAMERA_ATTRS = (
+    "pixel_height", "pixel_width", "frame_height", "frame_width",
+    "frame_center", "background_color", "background_opacity",
+)
+# Deep enough for AnimationGroup -> Animation -> kwargs, shallow enough
+# to stay clear of reference cycles
+MAX_DEPTH = 4
+
+_code_digests = {}
+_code_names = {}
+
+
+def fast_hash_enabled():
+    return os.environ.get("FAST_HASH", "0").lower() in ("1", "on", "true")
+
+
+def code_digest(code):
+    digest = _code_digests.get(code)
+    if digest is None:
+        h = hashlib.blake2b(digest_size=16)
+        h.update(code.co_code)
+        h.update(repr((getattr(code, "co_qualname", code.co_name), code.co_names)).encode())
+        for const in code.co_consts:
+            # Nested code objects repr with their address, so digest them instead
+            h.update(code_digest(const) if isinstance(const, types.CodeType) else repr(const).encode())
+        digest = _code_digests[code] = h.digest()
+    return digest
+
+
+def code_names(code):
+    # Every name the code and its nested lambdas/comprehensions look up
+    names = _code_names.get(code)
+    if names is None:
+        names = set(code.co_names)
+        for const in code.co_consts:
+            if isinstance(const, types.CodeType):
+                names.update(code_names(const))
+        names = _code_names[code] = tuple(sorted(names))
+    return names
+
+
+def update_digest(h, value, depth=0):
+    if isinstance(value, Mobject):
+        for mob in value.get_family():
+            h.update(mobject_fingerprint(mob))
+            for updater in mob.updaters:
+                update_digest(h, updater, depth + 1)
+    elif isinstance(value, np.ndarray):
+        h.update(f"{value.dtype}{value.shape}".encode())
+        h.update(np.ascontiguousarray(value).tobytes())
+    elif value is None or isinstance(value, (str, int, float, complex)):
+        h.update(repr(value).encode())
+    elif isinstance(value, (types.ModuleType, type)):
+        h.update(f"{type(value).__name__}:{getattr(value, '__qualname__', value.__name__)}".encode())
+    elif isinstance(value, types.MethodType):
+        update_digest(h, value.__self__, depth + 1)
+        update_digest(h, value.__func__, depth)
+    elif isinstance(value, types.FunctionType):
+        h.update(code_digest(value.__code__))
+        if depth >= MAX_DEPTH:
+            return
+        # Closure contents and globals can change between plays, so they
+        # are never memoized
+        for cell in value.__closure__ or ():
+            update_digest(h, cell.cell_contents, depth + 1)
+        scope = value.__globals__
+        for name in code_names(value.__code__):
+            if name in scope:
+                h.update(name.encode())
+                update_digest(h, scope[name], depth + 1)
+    elif depth >= MAX_DEPTH:
+        h.update(type(value).__name__.encode())
+    elif isinstance(value, (list, tuple)):
+        h.update(f"{type(value).__name__}{len(value)}".encode())
+        for item in value:
+            update_digest(h, item, depth + 1)
+    elif isinstance(value, dict):
+        for key in sorted(value, key=repr):
+            h.update(repr(key).encode())
+            update_digest(h, value[key], depth + 1)
+    elif hasattr(value, "__dict__"):
+        h.update(type(value).__name__.encode())
+        update_digest(h, vars(value), depth + 1)
+    else:
+        h.update(repr(value).encode())
+
+
+def animation_digest(h, animation):
+    h.update(type(animation).__name__.encode())
+    # The starting copy appears at begin(), after the hash is taken
+    update_digest(h, {k: v for k, v in vars(animation).items() if k != "starting_mobject"})
+
+
+def get_fast_hash_from_play_call(scene_object, camera_object, animations_list, current_mobjects_list):
+    camera = hashlib.blake2b(type(camera_object).__name__.encode(), digest_size=8)
+    for attr in CAMERA_ATTRS:
+        update_digest(camera, getattr(camera_object, attr, None))
+
+    animations = hashlib.blake2b(digest_size=8)
+    for animation in animations_list:
+        if isinstance(animation, Animation):
+            animation_digest(animations, animation)
+        else:
+            update_digest(animations, animation)
+
+    mobjects = hashlib.blake2b(digest_size=8)
+    for mob in current_mobjects_list:
+        update_digest(mobjects, mob)
+    return f"{camera.hexdigest()}_{animations.hexdigest()}_{mobjects.hexdigest()}"
+
+
+def install_fast_hash():
+    import manim.renderer.cairo_renderer as cairo_renderer
+
+    # The renderer imported the function by name, so patch its reference
+    cairo_renderer.get_hash_from_play_call = get_fast_hash_from_play_call
+
+
+class FastHashMixin:
+    def setup(self):
+        super().setup()
+        if fast_hash_enabled():
+            install_fast_hash()
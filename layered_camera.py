@@ -0,0 +1,123 @@
+# --- Layered (static-layer cached) camera ---
+# With LAYERED_RENDER=1 the camera splits the display list into runs of
+# mobjects that did or did not change since the previous frame. Unchanged
+# runs are rasterized once into a transparent layer and then composited
+# with NumPy on later frames; only the changing runs go through Cairo.
+# A mobject counts as changed when its points, style or position in the
+# z-order differ, so the cache invalidates itself.
+#
+# Cairo's OVER operator is associative, so drawing a run into its own
+# premultiplied layer and compositing it gives the same pixels as drawing
+# it straight onto the frame.
+
+import hashlib
+import itertools as it
+import os
+from collections import OrderedDict
+
+import numpy as np
+from manim import Camera
+
+STYLE_ATTRS = (
+    "fill_rgbas",
+    "stroke_rgbas",
+    "background_stroke_rgbas",
+    "stroke_width",
+    "background_stroke_width",
+    "sheen_factor",
+    "sheen_direction",
+    "rgbas",
+    "radii",
+    "pixel_array",
+    "z_index",
+    "glow",
+    "snapshot_key",
+)
+
+
+def layered_enabled():
+    return os.environ.get("LAYERED_RENDER", "0").lower() in ("1", "on", "true")
+
+
+def mobject_fingerprint(mob):
+    digest = hashlib.blake2b(type(mob).__name__.encode(), digest_size=16)
+    digest.update(np.ascontiguousarray(mob.points).tobytes())
+    for attr in STYLE_ATTRS:
+        value = getattr(mob, attr, None)
+        if value is None:
+            continue
+        if isinstance(value, np.ndarray):
+            digest.update(np.ascontiguousarray(value).tobytes())
+        else:
+            digest.update(repr(value).encode())
+    return digest.digest()
+
+
+def composite_premultiplied(dst, src, bounds):
+    r0, r1, c0, c1 = bounds
+    layer = src[r0:r1, c0:c1].astype(np.uint16)
+    below = dst[r0:r1, c0:c1].astype(np.uint16)
+    out = layer + (below * (255 - layer[..., 3:4]) + 127) // 255
+    dst[r0:r1, c0:c1] = np.minimum(out, 255).astype(np.uint8)
+
+
+class LayeredCamera(Camera):
+    def __init__(self, *args, layered=None, max_layers=8, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.layered = layered_enabled() if layered is None else layered
+        self.max_layers = max_layers
+        self._previous = {}
+        self._layers = OrderedDict()
+        self.layer_stats = {"hits": 0, "builds": 0, "direct": 0}
+
+    def capture_mobjects(self, mobjects, **kwargs):
+        if not self.layered:
+            return super().capture_mobjects(mobjects, **kwargs)
+
+        mobjects = self.get_mobjects_to_display(mobjects, **kwargs)
+        fingerprints = [mobject_fingerprint(mob) for mob in mobjects]
+        stable = [self._previous.get(id(mob)) == fp for mob, fp in zip(mobjects, fingerprints)]
+
+        for is_stable, run in it.groupby(range(len(mobjects)), key=lambda i: stable[i]):
+            run = list(run)
+            run_mobjects = [mobjects[i] for i in run]
+            if not is_stable:
+                self.layer_stats["direct"] += len(run)
+                self.rasterize(run_mobjects, self.pixel_array)
+                continue
+            # The run key covers content and order, so any edit misses the cache
+            key = tuple(fingerprints[i] for i in run)
+            layer = self._layers.get(key)
+            if layer is None:
+                layer = self._build_layer(key, run_mobjects)
+            else:
+                self._layers.move_to_end(key)
+                self.layer_stats["hits"] += 1
+            buffer, bounds = layer
+            if bounds is not None:
+                composite_premultiplied(self.pixel_array, buffer, bounds)
+
+        self._previous.update((id(mob), fp) for mob, fp in zip(mobjects, fingerprints))
+        if len(self._previous) > 4 * max(len(mobjects), 256):
+            self._previous = {id(mob): fp for mob, fp in zip(mobjects, fingerprints)}
+
+    def rasterize(self, mobjects, pixel_array):
+        for group_type, group in it.groupby(mobjects, self.type_or_raise):
+            self.display_funcs[group_type](list(group), pixel_array)
+
+    def _build_layer(self, key, mobjects):
+        buffer = np.zeros_like(self.pixel_array)
+        self.rasterize(mobjects, buffer)
+        rows = np.flatnonzero(buffer[..., 3].any(axis=1))
+        cols = np.flatnonzero(buffer[..., 3].any(axis=0))
+        bounds = None
+        if len(rows):
+            bounds = (rows[0], rows[-1] + 1, cols[0], cols[-1] + 1)
+
+        self._layers[key] = (buffer, bounds)
+        self.layer_stats["builds"] += 1
+        while len(self._layers) > self.max_layers:
+            old_buffer, _ = self._layers.popitem(last=False)[1]
+            # Cairo contexts are cached by array id, which may be reused
+            self.pixel_array_to_cairo_context.pop(id(old_buffer), None)
+        return self._layers[key]
@@ -0,0 +1,47 @@
+# --- Level of detail ---
+# Effects ask lod_count() / lod_segments() / lod_glow() how much detail
+# to build. Every render gets full detail unless it is explicitly a
+# preview: manim's -ql, or RENDER_LOD=preview (render_all.py --preview).
+# 480p and 720p are published too, so pixel height alone never lowers
+# detail. Positions and sizes are never scaled, so previews keep the same
+# layout.
+#
+# RENDER_LOD=<0..1> forces a level, RENDER_LOD=full turns LOD off.
+
+import os
+
+from manim import config
+
+# Level used for previews
+PREVIEW_LOD = 0.35
+# Below this level glows are skipped entirely
+GLOW_MIN_LOD = 0.5
+
+
+def lod_level():
+    forced = os.environ.get("RENDER_LOD", "").strip().lower()
+    if forced in ("full", "off"):
+        return 1.0
+    if forced == "preview":
+        return PREVIEW_LOD
+    if forced:
+        return min(max(float(forced), 0.0), 1.0)
+    return PREVIEW_LOD if config.quality == "low_quality" else 1.0
+
+
+def lod_count(n, minimum=1):
+    level = lod_level()
+    if level >= 1.0:
+        return n
+    return max(minimum, min(n, round(n * level)))
+
+
+def lod_segments(n, minimum=2):
+    # manim's num_components for arcs, which gives n - 1 cubics. A quarter
+    # turn per cubic still looks round, so callers pick minimum to match:
+    # 2 up to 90 degrees, 3 for a half turn, 5 for a full ellipse
+    return lod_count(n, minimum)
+
+
+def lod_glow():
+    return lod_level() >= GLOW_MIN_LOD
@@ -0,0 +1,71 @@
+# --- Full-mesh edges as one mobject ---
+# FullMesh draws all C(n, 2) edges between n nodes as a single VMobject.
+# Each edge is one straight cubic (4 points), so edge k lives at
+# points[4k:4k + 4] and every start/end is a strided view into one array.
+# MeshJitter perturbs every endpoint at once instead of building one
+# .animate per Line, which stops scaling somewhere in the low thousands.
+
+from manim import *
+
+
+def straight_cubics(starts, ends):
+    # One straight cubic per (start, end) pair, handles at thirds. Pairs
+    # don't share endpoints, so the camera draws each as its own subpath
+    weights = np.array([0, 1 / 3, 2 / 3, 1])[None, :, None]
+    starts, ends = starts[:, None, :], ends[:, None, :]
+    return (starts + (ends - starts) * weights).reshape(-1, 3)
+
+
+class FullMesh(VMobject):
+    def __init__(self, nodes, **kwargs):
+        super().__init__(**kwargs)
+        centers = np.array([
+            node.get_center() if isinstance(node, Mobject) else node for node in nodes
+        ], dtype=float).reshape(-1, 3)
+        self.edge_index = np.triu_indices(len(centers), k=1)
+        i, j = self.edge_index
+        self.set_endpoints(centers[i], centers[j])
+
+    @property
+    def num_edges(self):
+        return len(self.edge_index[0])
+
+    def get_starts(self):
+        return self.points[0::4]
+
+    def get_ends(self):
+        return self.points[3::4]
+
+    def set_endpoints(self, starts, ends):
+        self.points = straight_cubics(starts, ends)
+        return self
+
+    def jitter(self, amplitude=0.05, **kwargs):
+        return MeshJitter(self, amplitude=amplitude, **kwargs)
+
+
+class MeshJitter(Animation):
+    def __init__(self, mesh, amplitude=0.05, **kwargs):
+        self.amplitude = amplitude
+        super().__init__(mesh, **kwargs)
+
+    def create_starting_mobject(self):
+        # Start state is kept as plain arrays in begin(), no deep copy needed
+        return self.mobject
+
+    def begin(self):
+        mesh = self.mobject
+        self.start_starts = mesh.get_starts().copy()
+        self.start_ends = mesh.get_ends().copy()
+        # Uses the global NumPy RNG, so DeterministicMixin seeding applies
+        self.start_offsets = np.random.randn(mesh.num_edges, 3) * self.amplitude
+        self.end_offsets = np.random.randn(mesh.num_edges, 3) * self.amplitude
+        self.start_offsets[:, 2] = self.end_offsets[:, 2] = 0
+        super().begin()
+
+    def interpolate_mobject(self, alpha):
+        t = self.rate_func(alpha)
+        self.mobject.set_endpoints(
+            self.start_starts + self.start_offsets * t,
+            self.start_ends + self.end_offsets * t,
+        )
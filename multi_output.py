@@ -0,0 +1,188 @@
+# --- Render once, encode many outputs ---
+# MULTI_OUTPUTS="1280x720,854x480,gif:480x270@15" makes an ExplainerScene
+# feed every frame it writes (at the render quality, which should be the
+# largest one) to extra encoders as well. Each output center-crops to its
+# own aspect ratio, area-downscales with a separable cumulative-sum filter,
+# and pipes raw RGBA into its own ffmpeg process on its own thread, so the
+# outputs encode in parallel while construct() runs only once.
+#
+#   python multi_output.py saga_animation.SagaStory -q h \
+#       --outputs 1280x720 854x480 1080x1080 gif:480x270@12
+#
+# Outputs land in media/outputs/<Scene>_<W>x<H>.mp4 (or .gif). Partial-movie
+# caching skips frames, so the CLI renders with caching disabled.
+
+import argparse
+import os
+import queue
+import subprocess
+import sys
+import threading
+from pathlib import Path
+
+import numpy as np
+from manim import config, logger
+
+from video_io import ffmpeg_binary
+
+OUTPUTS_ENV = "MULTI_OUTPUTS"
+
+
+def output_specs():
+    value = os.environ.get(OUTPUTS_ENV, "").strip()
+    return [spec for spec in value.split(",") if spec]
+
+
+def parse_spec(spec):
+    kind, _, size = spec.rpartition(":")
+    size, _, fps = size.partition("@")
+    width, height = (int(v) for v in size.lower().split("x"))
+    kind = kind or "mp4"
+    if kind not in ("mp4", "gif"):
+        raise ValueError(f"Unknown output kind in {spec!r}")
+    if kind == "mp4" and (width % 2 or height % 2):
+        raise ValueError(f"H.264 output needs even dimensions: {spec!r}")
+    return kind, width, height, int(fps) if fps else 15
+
+
+def center_crop(frame, width, height):
+    # Largest centered window with the target aspect ratio
+    rows, cols = frame.shape[:2]
+    if cols * height > rows * width:
+        keep = round(rows * width / height)
+        start = (cols - keep) // 2
+        return frame[:, start:start + keep]
+    keep = round(cols * height / width)
+    start = (rows - keep) // 2
+    return frame[start:start + keep]
+
+
+def area_resize_axis(pixels, size, axis):
+    # Exact box filter for any ratio: each output pixel is the mean of the
+    # input span it covers, read off a running sum at fractional edges
+    n = pixels.shape[axis]
+    if n == size:
+        return pixels
+    sums = np.concatenate(
+        [np.zeros_like(np.take(pixels, [0], axis=axis)), np.cumsum(pixels, axis=axis)], axis=axis
+    )
+    edges = np.linspace(0, n, size + 1)
+    whole = np.minimum(edges.astype(np.intp), n - 1)
+    frac = (edges - whole).reshape([-1 if a == axis else 1 for a in range(pixels.ndim)])
+    at_edges = np.take(sums, whole, axis=axis) + frac * np.take(pixels, whole, axis=axis)
+    return np.diff(at_edges, axis=axis) * (size / n)
+
+
+def area_resize(frame, width, height):
+    pixels = frame.astype(np.float32)
+    pixels = area_resize_axis(area_resize_axis(pixels, height, 0), width, 1)
+    return np.clip(pixels + 0.5, 0, 255).astype(np.uint8)
+
+
+class OutputEncoder:
+    def __init__(self, spec, path, frame_rate):
+        self.kind, self.width, self.height, gif_fps = parse_spec(spec)
+        self.path = Path(path).with_suffix(f".{self.kind}")
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        command = [
+            ffmpeg_binary(), "-y", "-loglevel", "error",
+            "-f", "rawvideo", "-pix_fmt", "rgba", "-s", f"{self.width}x{self.height}",
+            "-r", str(frame_rate), "-i", "-", "-an",
+        ]
+        if self.kind == "gif":
+            command += ["-vf", f"fps={gif_fps},split[a][b];[a]palettegen[p];[b][p]paletteuse"]
+        else:
+            command += ["-c:v", "libx264", "-pix_fmt", "yuv420p", "-crf", "23", "-movflags", "+faststart"]
+        self.process = subprocess.Popen(command + [str(self.path)], stdin=subprocess.PIPE)
+        # Small bound: a slow encoder holds the renderer back instead of
+        # piling up frames in memory
+        self.frames = queue.Queue(maxsize=4)
+        self.error = None
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+
+    def submit(self, frame, num_frames=1):
+        self.frames.put((frame, num_frames))
+
+    def _run(self):
+        while (item := self.frames.get()) is not None:
+            if self.error is not None:
+                # Keep draining so the renderer never blocks on a dead encoder
+                continue
+            frame, num_frames = item
+            try:
+                data = area_resize(center_crop(frame, self.width, self.height), self.width, self.height).tobytes()
+                for _ in range(num_frames):
+                    self.process.stdin.write(data)
+            except Exception as exc:
+                self.error = exc
+
+    def close(self):
+        self.frames.put(None)
+        self.thread.join()
+        try:
+            self.process.stdin.close()
+        except BrokenPipeError:
+            pass
+        if self.process.wait() or self.error is not None:
+            raise RuntimeError(f"ffmpeg failed writing {self.path}: {self.error!r}")
+        return self.path
+
+
+class MultiOutputMixin:
+    def setup(self):
+        super().setup()
+        self.output_encoders = []
+        specs = output_specs()
+        if specs and not self.renderer.skip_animations:
+            self._install_outputs(specs)
+
+    def _install_outputs(self, specs):
+        name = type(self).__name__
+        out_dir = Path(config.media_dir) / "outputs"
+        for spec in specs:
+            _, width, height, _ = parse_spec(spec)
+            self.output_encoders.append(OutputEncoder(spec, out_dir / f"{name}_{width}x{height}", config.frame_rate))
+
+        writer = self.renderer.file_writer
+        write_frame = writer.write_frame
+
+        def wrapper(frame, num_frames=1):
+            write_frame(frame, num_frames=num_frames)
+            # The pipelined renderer hands over the live camera buffer
+            if frame is self.renderer.camera.pixel_array:
+                frame = frame.copy()
+            for encoder in self.output_encoders:
+                encoder.submit(frame, num_frames)
+
+        writer.write_frame = wrapper
+
+    def tear_down(self):
+        super().tear_down()
+        if self.output_encoders:
+            paths = [encoder.close() for encoder in self.output_encoders]
+            logger.info(f"Extra outputs: {', '.join(str(p) for p in paths)}")
+
+
+def main(argv=None):
+    from render_all import render_scene
+
+    parser = argparse.ArgumentParser(description="Render a scene once into several outputs.")
+    parser.add_argument("scene", help="module.SceneName, e.g. saga_animation.SagaStory")
+    parser.add_argument("-q", "--quality", default="h", choices=list("lmhpk"),
+                        help="render (and main output) quality; the largest output")
+    parser.add_argument("--outputs", nargs="+", default=["1280x720", "854x480", "gif:480x270@15"],
+                        help="extra outputs as WxH or gif:WxH@fps")
+    args = parser.parse_args(argv)
+
+    for spec in args.outputs:
+        parse_spec(spec)
+    os.environ[OUTPUTS_ENV] = ",".join(args.outputs)
+    module_name, scene_name = args.scene.rsplit(".", 1)
+    result = render_scene(module_name, scene_name, args.quality, disable_caching=True)
+    print(f"done   {result['scene']} in {result['wall_time']:.1f}s -> {result['output']} + {len(args.outputs)} outputs")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,133 @@
+# --- Odometer counter ---
+# A numeric counter built from a digit glyph atlas. Changing its value
+# copies ready-made digit outlines into fixed slots, and roll_to() animates
+# the change by sliding the old digit out and the new one in, so there is
+# no new text layout and no point alignment between different glyphs.
+
+from manim import *
+
+from glyph_atlas import DIGITS, GlyphAtlas
+
+
+class Odometer(VGroup):
+    def __init__(self, value=0, num_digits=None, color=WHITE, font_size=48, **text_kwargs):
+        super().__init__()
+        atlas = GlyphAtlas.get(DIGITS, font_size=font_size, **text_kwargs)
+        self.atlas_key = atlas.key
+        self.num_digits = num_digits or len(str(value))
+        self.digit_color = ManimColor(color)
+
+        # Invisible frame that fixes the slot positions and the bounding box
+        self.frame = Rectangle(width=self.num_digits * atlas.cell_width, height=atlas.height)
+        self.frame.set_stroke(opacity=0).set_fill(opacity=0)
+        self.add(self.frame)
+
+        self.chars = [" "] * self.num_digits
+        self.slot_glyphs = [None] * self.num_digits
+        self.value = None
+        self.set_value(value)
+
+    @property
+    def atlas(self):
+        return GlyphAtlas.lookup(self.atlas_key)
+
+    def format_value(self, value):
+        if int(value) != value or value < 0 or len(str(int(value))) > self.num_digits:
+            raise ValueError(f"Odometer with {self.num_digits} digit(s) cannot show {value!r}")
+        return str(int(value)).rjust(self.num_digits)
+
+    def slot_scale(self):
+        return self.frame.width / (self.num_digits * self.atlas.cell_width)
+
+    def slot_center(self, index):
+        cell = self.frame.width / self.num_digits
+        return self.frame.get_left() + RIGHT * cell * (index + 0.5)
+
+    def make_glyph(self, ch, index, color=None):
+        glyph = self.atlas.glyph(ch)
+        glyph.scale(self.slot_scale(), about_point=ORIGIN)
+        glyph.shift(self.slot_center(index))
+        glyph.set_fill(color or self.digit_color, opacity=1).set_stroke(width=0)
+        return glyph
+
+    def set_value(self, value, color=None):
+        if color is not None:
+            self.digit_color = ManimColor(color)
+        chars = self.format_value(value)
+        for i, ch in enumerate(chars):
+            old = self.slot_glyphs[i]
+            if ch == self.chars[i] and old is not None:
+                old.set_fill(self.digit_color)
+                continue
+            if old is not None:
+                self.remove(old)
+            self.slot_glyphs[i] = None if ch == " " else self.make_glyph(ch, i)
+            if self.slot_glyphs[i] is not None:
+                self.add(self.slot_glyphs[i])
+        self.chars = list(chars)
+        self.value = int(value)
+        return self
+
+    def get_value(self):
+        return self.value
+
+    def roll_to(self, value, color=None, **kwargs):
+        return RollTo(self, value, color=color, **kwargs)
+
+
+class RollTo(Animation):
+    def __init__(self, odometer, value, color=None, direction=UP, **kwargs):
+        self.target_value = value
+        self.target_color = ManimColor(color) if color is not None else None
+        self.direction = direction
+        super().__init__(odometer, **kwargs)
+
+    def create_starting_mobject(self):
+        # Nothing is interpolated from a snapshot, so skip the deep copy
+        return self.mobject
+
+    def begin(self):
+        odo = self.mobject
+        color = self.target_color or odo.digit_color
+        new_chars = odo.format_value(self.target_value)
+        self.travel = odo.frame.height * self.direction
+        self.rolls = []
+        self.recolors = []
+        for i, (old, new) in enumerate(zip(odo.chars, new_chars)):
+            outgoing = odo.slot_glyphs[i]
+            if old == new:
+                if outgoing is not None and self.target_color is not None:
+                    self.recolors.append((outgoing, outgoing.get_fill_color()))
+                continue
+            incoming = None if new == " " else odo.make_glyph(new, i, color)
+            if incoming is not None:
+                incoming.shift(-self.travel)
+                odo.add(incoming)
+            # Each roll remembers how far its glyphs have moved so far
+            self.rolls.append([i, outgoing, incoming, 0.0])
+        super().begin()
+
+    def interpolate_mobject(self, alpha):
+        t = self.rate_func(alpha)
+        for roll in self.rolls:
+            _, outgoing, incoming, done = roll
+            step = self.travel * (t - done)
+            if outgoing is not None:
+                outgoing.shift(step).set_fill(opacity=1 - t)
+            if incoming is not None:
+                incoming.shift(step).set_fill(opacity=t)
+            roll[3] = t
+        for glyph, start_color in self.recolors:
+            glyph.set_fill(interpolate_color(start_color, self.target_color, t))
+
+    def finish(self):
+        super().finish()
+        odo = self.mobject
+        for index, outgoing, incoming, _ in self.rolls:
+            if outgoing is not None:
+                odo.remove(outgoing)
+            odo.slot_glyphs[index] = incoming
+        odo.chars = list(odo.format_value(self.target_value))
+        odo.value = int(self.target_value)
+        if self.target_color is not None:
+            odo.digit_color = self.target_color
@@ -0,0 +1,132 @@
+# --- Particle system ---
+# One mobject for a whole swarm of round particles. Positions are the
+# mobject's points (so shift/scale/move_to just work) and velocities,
+# radii and RGBA colors live in parallel NumPy arrays. The camera draws a
+# system in one pass, filling every particle that shares a color and
+# opacity as one Cairo path. burst() and implode() animate all particles
+# with a single vectorized interpolation instead of one Animation each.
+
+from manim import *
+
+
+class ParticleSystem(Mobject):
+    def __init__(self, positions, colors=WHITE, radius=0.1, opacity=1.0, velocities=None, **kwargs):
+        super().__init__(**kwargs)
+        positions = np.array(positions, dtype=float).reshape(-1, 3)
+        n = len(positions)
+        self.points = positions
+        self.velocities = np.zeros((n, 3)) if velocities is None else np.array(velocities, dtype=float).reshape(n, 3)
+        self.radii = np.broadcast_to(np.asarray(radius, dtype=float), (n,)).copy()
+
+        colors = [colors] if isinstance(colors, (str, ManimColor)) else list(colors)
+        palette = np.array([color_to_rgb(c) for c in colors])
+        if len(palette) == n:
+            rgb = palette
+        else:
+            rgb = palette[np.arange(n) % len(palette)]
+        self.rgbas = np.column_stack([rgb, np.broadcast_to(np.asarray(opacity, dtype=float), (n,))])
+
+    @classmethod
+    def scattered(cls, n, colors=WHITE, x_range=(-4, 4), y_range=(-4, 4), speed=0.0, **kwargs):
+        # Uses the global NumPy RNG, so DeterministicMixin seeding applies
+        positions = np.zeros((n, 3))
+        positions[:, 0] = np.random.uniform(*x_range, n)
+        positions[:, 1] = np.random.uniform(*y_range, n)
+        palette = [colors] if isinstance(colors, (str, ManimColor)) else list(colors)
+        picked = [palette[i] for i in np.random.randint(0, len(palette), n)]
+        velocities = np.zeros((n, 3))
+        velocities[:, :2] = np.random.uniform(-speed, speed, (n, 2))
+        return cls(positions, colors=picked, velocities=velocities, **kwargs)
+
+    def get_array_attrs(self):
+        return super().get_array_attrs() + ["velocities", "radii", "rgbas"]
+
+    # --- Style ---
+
+    def set_color(self, color=WHITE, family=True):
+        self.rgbas[:, :3] = color_to_rgb(color)
+        self.color = ManimColor(color)
+        return self
+
+    def set_opacity(self, opacity, family=True):
+        self.rgbas[:, 3] = opacity
+        return self
+
+    def get_opacity(self):
+        return self.rgbas[:, 3].max() if len(self.rgbas) else 0.0
+
+    def fade(self, darkness=0.5, family=True):
+        self.rgbas[:, 3] *= 1 - darkness
+        return self
+
+    def scale(self, scale_factor, **kwargs):
+        super().scale(scale_factor, **kwargs)
+        self.radii *= abs(scale_factor)
+        return self
+
+    def interpolate_color(self, mobject1, mobject2, alpha):
+        self.rgbas = interpolate(mobject1.rgbas, mobject2.rgbas, alpha)
+        self.radii = interpolate(mobject1.radii, mobject2.radii, alpha)
+
+    # --- Animations ---
+
+    def burst(self, spread=1.0, fade_out=True, **kwargs):
+        targets = self.points + self.velocities * spread
+        return ParticleFlow(self, targets, opacity=0 if fade_out else None, **kwargs)
+
+    def implode(self, point=ORIGIN, fade_out=True, **kwargs):
+        targets = np.broadcast_to(np.asarray(point, dtype=float), self.points.shape)
+        return ParticleFlow(self, targets, opacity=0 if fade_out else None, **kwargs)
+
+
+class ParticleFlow(Animation):
+    def __init__(self, particles, targets, opacity=None, **kwargs):
+        self.targets = np.array(targets, dtype=float)
+        self.target_opacity = opacity
+        super().__init__(particles, **kwargs)
+
+    def create_starting_mobject(self):
+        # Start state is kept as plain arrays in begin(), no deep copy needed
+        return self.mobject
+
+    def begin(self):
+        self.start_points = self.mobject.points.copy()
+        self.start_opacity = self.mobject.rgbas[:, 3].copy()
+        super().begin()
+
+    def interpolate_mobject(self, alpha):
+        t = self.rate_func(alpha)
+        particles = self.mobject
+        particles.points = self.start_points + (self.targets - self.start_points) * t
+        if self.target_opacity is not None:
+            particles.rgbas[:, 3] = self.start_opacity + (self.target_opacity - self.start_opacity) * t
+
+
+class ParticleCameraMixin:
+    def type_or_raise(self, mobject):
+        mob_type = super().type_or_raise(mobject)
+        # Camera rebuilds display_funcs inside type_or_raise, so register every time
+        self.display_funcs[ParticleSystem] = self.display_particle_systems
+        return ParticleSystem if isinstance(mobject, ParticleSystem) else mob_type
+
+    def display_particle_systems(self, systems, pixel_array):
+        ctx = self.get_cairo_context(pixel_array)
+        for system in systems:
+            visible = system.rgbas[:, 3] > 0
+            if not visible.any():
+                continue
+            points = system.points[visible]
+            radii = system.radii[visible]
+            styles, groups = np.unique(
+                np.round(system.rgbas[visible] * 255).astype(np.uint8), axis=0, return_inverse=True
+            )
+            for index, style in enumerate(styles):
+                members = groups.ravel() == index
+                ctx.new_path()
+                for (x, y, _), r in zip(points[members], radii[members]):
+                    ctx.new_sub_path()
+                    ctx.arc(x, y, r, 0, TAU)
+                r, g, b, a = style / 255
+                # Same channel swap as Camera.set_cairo_context_color
+                ctx.set_source_rgba(b, g, r, a)
+                ctx.fill()
@@ -0,0 +1,158 @@
+# --- Per-play() render profiler ---
+# RENDER_PROFILE=1 records, for every play() and wait(): frames written,
+# wall time, and how that time splits between interpolation, updaters,
+# Cairo rasterization and the file writer, plus mobject and point counts.
+# At tear-down it writes media/profiles/<Scene>.json and a speedscope
+# profile (<Scene>.speedscope.json, open it at https://www.speedscope.app).
+#
+# When the flag is off nothing is wrapped, so rendering is untouched.
+
+import json
+import os
+import time
+from pathlib import Path
+
+from manim import config, logger
+
+PHASES = ("interpolate", "updaters", "rasterize", "write", "other")
+
+
+def profiling_enabled():
+    return os.environ.get("RENDER_PROFILE", "0").lower() in ("1", "on", "true")
+
+
+class ProfilerMixin:
+    def setup(self):
+        super().setup()
+        self.profile = None
+        if profiling_enabled():
+            self._install_profiler()
+
+    def _install_profiler(self):
+        self.profile = []
+        self._phase_times = dict.fromkeys(PHASES, 0.0)
+        self._frames = 0
+        renderer, writer = self.renderer, self.renderer.file_writer
+
+        # Instance attributes shadow the bound methods only on this scene
+        self.play = self._profiled_play(self.play)
+        self.update_to_time = self._timed(self.update_to_time, "interpolate")
+        self.update_mobjects = self._timed(self.update_mobjects, "updaters")
+        renderer.update_frame = self._timed(renderer.update_frame, "rasterize")
+        writer.write_frame = self._counted_write(writer.write_frame)
+
+    def _timed(self, func, phase):
+        times = self._phase_times
+
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                times[phase] += time.perf_counter() - start
+
+        return wrapper
+
+    def _counted_write(self, write_frame):
+        timed = self._timed(write_frame, "write")
+
+        def wrapper(frame, num_frames=1):
+            self._frames += num_frames
+            return timed(frame, num_frames=num_frames)
+
+        return wrapper
+
+    def _profiled_play(self, play):
+        def wrapper(*args, **kwargs):
+            index = self.renderer.num_plays
+            self._phase_times.update(dict.fromkeys(PHASES, 0.0))
+            self._frames = 0
+            start = time.perf_counter()
+            try:
+                return play(*args, **kwargs)
+            finally:
+                self._record(index, time.perf_counter() - start)
+
+        return wrapper
+
+    def _record(self, index, wall):
+        phases = dict(self._phase_times)
+        # update_to_time also runs the updaters, so split them back out
+        phases["interpolate"] = max(0.0, phases["interpolate"] - phases["updaters"])
+        phases["other"] = max(0.0, wall - sum(phases[p] for p in PHASES if p != "other"))
+        family = self.get_mobject_family_members()
+        self.profile.append({
+            "index": index,
+            "animations": [type(a).__name__ for a in (getattr(self, "animations", None) or [])],
+            "frames": self._frames,
+            "wall_time": wall,
+            "phases": phases,
+            "mobjects": len(family),
+            "points": int(sum(len(m.points) for m in family)),
+        })
+
+    def tear_down(self):
+        super().tear_down()
+        if self.profile is not None:
+            self.write_profile()
+
+    def write_profile(self):
+        name = type(self).__name__
+        out_dir = Path(config.media_dir) / "profiles"
+        out_dir.mkdir(parents=True, exist_ok=True)
+
+        report = {
+            "scene": name,
+            "pixel_height": config.pixel_height,
+            "frame_rate": config.frame_rate,
+            "total_wall_time": sum(p["wall_time"] for p in self.profile),
+            "total_frames": sum(p["frames"] for p in self.profile),
+            "plays": self.profile,
+        }
+        (out_dir / f"{name}.json").write_text(json.dumps(report, indent=2))
+        (out_dir / f"{name}.speedscope.json").write_text(json.dumps(speedscope_profile(name, self.profile)))
+
+        slowest = sorted(self.profile, key=lambda p: p["wall_time"], reverse=True)[:5]
+        logger.info(
+            f"Profile written to {out_dir}; slowest plays: "
+            + ", ".join(f"#{p['index']} {'+'.join(p['animations'])} {p['wall_time']:.2f}s" for p in slowest)
+        )
+
+
+def speedscope_profile(name, plays):
+    # Sampled profile: one stack per (play, phase) weighted by its seconds,
+    # which speedscope renders as a flame graph with one column per play
+    frames, frame_index = [], {}
+
+    def frame(label):
+        if label not in frame_index:
+            frame_index[label] = len(frames)
+            frames.append({"name": label})
+        return frame_index[label]
+
+    root = frame(name)
+    samples, weights = [], []
+    for play in plays:
+        label = f"#{play['index']:03d} {'+'.join(play['animations']) or 'play'}"
+        play_frame = frame(label)
+        for phase in PHASES:
+            seconds = play["phases"][phase]
+            if seconds > 0:
+                samples.append([root, play_frame, frame(phase)])
+                weights.append(seconds)
+
+    return {
+        "$schema": "https://www.speedscope.app/file-format-schema.json",
+        "name": name,
+        "exporter": "profiler.py",
+        "shared": {"frames": frames},
+        "profiles": [{
+            "type": "sampled",
+            "name": name,
+            "unit": "seconds",
+            "startValue": 0,
+            "endValue": sum(weights),
+            "samples": samples,
+            "weights": weights,
+        }],
+    }
@@ -0,0 +1,194 @@
+# --- Batch renderer ---
+# Finds every Scene in the repo and renders them in a process pool, one
+# scene per worker process, then writes a manifest to render.txt.
+#
+#   python render_all.py                 # every scene at high quality
+#   python render_all.py -q l -q h       # several qualities in one pass
+#   python render_all.py -s SagaStory    # only some scenes
+
+import argparse
+import importlib
+import inspect
+import os
+import resource
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent
+MANIFEST = ROOT / "render.txt"
+MEDIA_DIR = ROOT / "media"
+
+
+def discover_scenes(root=ROOT):
+    from manim import Scene
+
+    scenes = []
+    for path in sorted(root.glob("*.py")):
+        # Only import files that can actually hold a scene
+        if "def construct(" not in path.read_text(encoding="utf-8"):
+            continue
+        module = importlib.import_module(path.stem)
+        for name, obj in inspect.getmembers(module, inspect.isclass):
+            if (
+                issubclass(obj, Scene)
+                and obj.__module__ == module.__name__
+                and obj.construct is not Scene.construct
+                # Tool scenes such as title cards opt out of the catalog
+                and getattr(obj, "in_catalog", True)
+            ):
+                scenes.append((module.__name__, name))
+    return scenes
+
+
+def quality_config(flag):
+    from manim.constants import QUALITIES
+
+    for quality in QUALITIES.values():
+        if quality["flag"] == flag:
+            return {key: quality[key] for key in ("pixel_height", "pixel_width", "frame_rate")}
+    raise ValueError(f"Unknown quality flag: {flag!r}")
+
+
+def scene_config(module_name, quality, **overrides):
+    cfg = {
+        **quality_config(quality),
+        "input_file": ROOT / (module_name.replace(".", os.sep) + ".py"),
+        "media_dir": MEDIA_DIR,
+        "preview": False,
+        "progress_bar": "none",
+    }
+    cfg.update(overrides)
+    return cfg
+
+
+def load_scene(module_name, scene_name):
+    if str(ROOT) not in sys.path:
+        sys.path.insert(0, str(ROOT))
+    return getattr(importlib.import_module(module_name), scene_name)
+
+
+def directory_size(path):
+    if not path or not Path(path).is_dir():
+        return 0
+    return sum(f.stat().st_size for f in Path(path).iterdir() if f.is_file())
+
+
+def count_written_frames(writer):
+    # Counts what reaches the movie: skipped and cached plays write nothing
+    counter = {"frames": 0}
+    write_frame = writer.write_frame
+
+    def wrapper(frame, num_frames=1):
+        counter["frames"] += num_frames
+        return write_frame(frame, num_frames=num_frames)
+
+    writer.write_frame = wrapper
+    return counter
+
+
+def first_play_only(scene_cls):
+    # manim reads upto_animation_number=0 as "no limit", so stop by hand
+    from manim.utils.exceptions import EndSceneEarlyException
+
+    class FirstPlayOnly(scene_cls):
+        def play(self, *args, **kwargs):
+            if self.renderer.num_plays >= 1:
+                raise EndSceneEarlyException()
+            super().play(*args, **kwargs)
+
+    FirstPlayOnly.__name__ = FirstPlayOnly.__qualname__ = scene_cls.__name__
+    return FirstPlayOnly
+
+
+def render_scene(module_name, scene_name, quality, **overrides):
+    from manim import tempconfig
+
+    scene_cls = load_scene(module_name, scene_name)
+    if overrides.get("upto_animation_number") == 0:
+        scene_cls = first_play_only(scene_cls)
+    start = time.perf_counter()
+    with tempconfig(scene_config(module_name, quality, **overrides)):
+        scene = scene_cls()
+        written = count_written_frames(scene.renderer.file_writer)
+        scene.render()
+        output = scene.renderer.file_writer.movie_file_path
+        cache_dir = getattr(scene.renderer.file_writer, "partial_movie_directory", None)
+        culled = getattr(scene.camera, "cull_stats", {})
+    return {
+        "scene": f"{module_name}.{scene_name}",
+        "quality": quality,
+        "output": str(output) if output else "-",
+        "frames": written["frames"],
+        "cache_mb": directory_size(cache_dir) / 2**20,
+        "wall_time": time.perf_counter() - start,
+        # ru_maxrss is in KiB on Linux; each worker renders a single scene
+        "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+        "culled_mobjects": culled.get("mobjects", 0),
+        "culled_points": culled.get("points", 0),
+    }
+
+
+def write_manifest(results, total_time, path=MANIFEST):
+    lines = [
+        f"# Batch render - {len(results)} job(s), {total_time:.1f}s wall",
+        f"# {'scene':<48} {'quality':<8} {'wall_s':>8} {'peak_mb':>9} {'culled':>8} {'culled_pts':>11}  output",
+    ]
+    for r in sorted(results, key=lambda r: (r["scene"], r["quality"])):
+        lines.append(
+            f"{r['scene']:<50} {r['quality']:<8} {r['wall_time']:>8.1f} {r['peak_rss_mb']:>9.1f} "
+            f"{r['culled_mobjects']:>8} {r['culled_points']:>11}  {r['output']}"
+        )
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Render every scene in parallel.")
+    parser.add_argument("-q", "--quality", action="append", choices=list("lmhpk"),
+                        help="quality flag(s), like manim's -ql/-qh (default: h)")
+    parser.add_argument("-s", "--scene", action="append",
+                        help="only render these scene names")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count(),
+                        help="worker processes (default: core count)")
+    parser.add_argument("--profile", action="store_true",
+                        help="write per-play profiles to media/profiles (RENDER_PROFILE=1)")
+    parser.add_argument("--preview", action="store_true",
+                        help="build effects at preview detail (RENDER_LOD=preview)")
+    args = parser.parse_args(argv)
+
+    if args.profile:
+        # Inherited by the worker processes
+        os.environ["RENDER_PROFILE"] = "1"
+    if args.preview:
+        os.environ["RENDER_LOD"] = "preview"
+
+    qualities = args.quality or ["h"]
+    scenes = discover_scenes()
+    if args.scene:
+        scenes = [s for s in scenes if s[1] in args.scene]
+    jobs = [(module, name, q) for module, name in scenes for q in qualities]
+
+    start = time.perf_counter()
+    results, failed = [], 0
+    # One task per child keeps peak RSS per scene and stops leaks piling up
+    with ProcessPoolExecutor(max_workers=min(args.jobs, len(jobs)) or 1, max_tasks_per_child=1) as pool:
+        futures = {pool.submit(render_scene, *job): job for job in jobs}
+        for future in as_completed(futures):
+            module, name, q = futures[future]
+            try:
+                result = future.result()
+            except Exception as exc:
+                failed += 1
+                print(f"FAILED {module}.{name} [{q}]: {exc!r}", file=sys.stderr)
+                continue
+            results.append(result)
+            print(f"done   {result['scene']} [{q}] in {result['wall_time']:.1f}s")
+
+    write_manifest(results, time.perf_counter() - start)
+    print(f"Wrote {MANIFEST.name}: {len(results)} ok, {failed} failed")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
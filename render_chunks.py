@@ -0,0 +1,141 @@
+# --- Intra-scene parallel rendering ---
+# Splits one scene's play()/wait() timeline into N contiguous chunks and
+# renders each chunk in its own process. Every worker fast-forwards through
+# the animations before its chunk (manim's skip mode applies each
+# animation's end state without writing frames, though it still rasterizes
+# the static mobjects once per play) and stops after its last one; the
+# partial movies are then joined in order with a stream copy.
+#
+#   python render_chunks.py race_condition_animated.RaceConditionAnimated -j 8
+#   python render_chunks.py saga_animation.SagaStory -q l --check
+
+import argparse
+import math
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from render_all import load_scene, quality_config, render_scene, scene_config
+from video_io import concat_movies
+
+
+def measure_timeline(module_name, scene_name, quality):
+    # Run construct() in skip mode and record the duration of every play()
+    from manim import tempconfig
+
+    base = load_scene(module_name, scene_name)
+
+    class Timeline(base):
+        def play(self, *args, **kwargs):
+            start = self.renderer.time
+            super().play(*args, **kwargs)
+            self.play_durations.append(self.renderer.time - start)
+
+    overrides = {"write_to_movie": False, "save_last_frame": False, "disable_caching": True}
+    with tempconfig(scene_config(module_name, quality, **overrides)):
+        scene = Timeline(skip_animations=True)
+        scene.play_durations = []
+        scene.render()
+    return scene.play_durations
+
+
+def split_timeline(durations, chunks):
+    # Contiguous split that keeps every chunk close to total / chunks seconds
+    chunks = max(1, min(chunks, len(durations)))
+    target = sum(durations) / chunks
+    ranges, start, acc = [], 0, 0.0
+    for i, duration in enumerate(durations):
+        acc += duration
+        remaining_plays = len(durations) - i - 1
+        remaining_chunks = chunks - len(ranges) - 1
+        if remaining_chunks and (acc >= target or remaining_plays == remaining_chunks):
+            ranges.append((start, i))
+            start, acc = i + 1, 0.0
+    ranges.append((start, len(durations) - 1))
+    return ranges
+
+
+def render_chunk(module_name, scene_name, quality, index, first, last):
+    # A (0, 0) chunk is common (a long first play, or -j >= plays);
+    # render_scene stops it after play 0 itself
+    part = f"{scene_name}_part{index:02d}"
+    return render_scene(
+        module_name, scene_name, quality,
+        from_animation_number=first,
+        upto_animation_number=last,
+        output_file=part,
+        # Each chunk writes its own file list when combining, so keep them apart
+        partial_movie_dir="{video_dir}/partial_movie_files/" + part,
+    )
+
+
+def render_in_chunks(module_name, scene_name, quality="h", chunks=None, keep_parts=False):
+    chunks = chunks or os.cpu_count()
+    with ProcessPoolExecutor(max_workers=1) as pool:
+        durations = pool.submit(measure_timeline, module_name, scene_name, quality).result()
+    ranges = split_timeline(durations, chunks)
+
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=len(ranges), max_tasks_per_child=1) as pool:
+        futures = [
+            pool.submit(render_chunk, module_name, scene_name, quality, i, first, last)
+            for i, (first, last) in enumerate(ranges)
+        ]
+        parts = [Path(f.result()["output"]) for f in futures]
+
+    output = parts[0].with_name(f"{scene_name}{parts[0].suffix}")
+    concat_movies(parts, output)
+    if not keep_parts:
+        for part in parts:
+            part.unlink(missing_ok=True)
+
+    for (first, last), part in zip(ranges, parts):
+        chunk_time = sum(durations[first:last + 1])
+        print(f"  plays {first:>3}-{last:<3} {chunk_time:6.2f}s of video  -> {part.name}")
+    print(f"{scene_name}: {len(durations)} plays in {len(ranges)} chunks, "
+          f"{time.perf_counter() - start:.1f}s wall -> {output}")
+    return output
+
+
+def check_chunks(module_name, scene_name, quality="l"):
+    # Regression check for ranges that end at play 0, which manim would
+    # otherwise render through the end of the scene
+    cases = (([1.0] * 15, 15), ([3, 1, 1, 1, 1, 1], 4), ([1.0] * 3, 8))
+    for durations, chunks in cases:
+        ranges = split_timeline(durations, chunks)
+        assert ranges[0] == (0, 0), ranges
+        assert ranges[-1][1] == len(durations) - 1, ranges
+        assert all(a[1] + 1 == b[0] for a, b in zip(ranges, ranges[1:])), ranges
+
+    with ProcessPoolExecutor(max_workers=1, max_tasks_per_child=1) as pool:
+        durations = pool.submit(measure_timeline, module_name, scene_name, quality).result()
+    with ProcessPoolExecutor(max_workers=1, max_tasks_per_child=1) as pool:
+        result = pool.submit(render_chunk, module_name, scene_name, quality, 0, 0, 0).result()
+    Path(result["output"]).unlink(missing_ok=True)
+    limit = math.ceil(durations[0] * quality_config(quality)["frame_rate"]) + 1
+    assert result["frames"] <= limit, f"chunk (0, 0) wrote {result['frames']} frames, play 0 has {limit - 1}"
+    print(f"{scene_name}: split_timeline and the single-play chunk check out")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Render one scene as parallel chunks.")
+    parser.add_argument("scene", help="module.SceneName, e.g. saga_animation.SagaStory")
+    parser.add_argument("-q", "--quality", default="h", choices=list("lmhpk"))
+    parser.add_argument("-j", "--chunks", type=int, default=os.cpu_count())
+    parser.add_argument("--keep-parts", action="store_true")
+    parser.add_argument("--check", action="store_true",
+                        help="check the chunk split and a play-0-only chunk instead of rendering")
+    args = parser.parse_args(argv)
+
+    module_name, scene_name = args.scene.rsplit(".", 1)
+    if args.check:
+        check_chunks(module_name, scene_name, args.quality)
+        return 0
+    render_in_chunks(module_name, scene_name, args.quality, args.chunks, args.keep_parts)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
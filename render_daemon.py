@@ -0,0 +1,157 @@
+# --- Warm render daemon ---
+# A long-lived pool of render workers behind a local Unix socket. Each
+# worker imports manim and every scene module once, and builds one Text to
+# warm up Pango and fontconfig, so a job only pays for the render itself.
+# The pool is started and warmed before the socket opens. A worker is
+# replaced after --recycle jobs to cap memory growth; the replacement
+# warms up inside the next job it is given.
+#
+#   python render_daemon.py serve -j 4 --recycle 20
+#   python render_daemon.py submit SagaStory -q l --from 3 --upto 7
+#
+# The protocol is one JSON object per line each way. A job is
+# {"scene": ..., "quality": ..., "from": ..., "upto": ...}, where the range
+# is inclusive and optional. The reply is render_all's result dict, or
+# {"error": ...}. Its peak_rss_mb is the worker's peak so far, not the
+# job's own.
+
+import argparse
+import json
+import os
+import socket
+import socketserver
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+from render_all import MEDIA_DIR, discover_scenes, load_scene, render_scene
+
+SOCKET_PATH = os.environ.get("RENDER_SOCKET", str(MEDIA_DIR / "render.sock"))
+
+
+def warm_worker(scenes):
+    # Runs once per worker process, including recycled replacements
+    from text_cache import cached_text
+
+    for module_name, scene_name in scenes:
+        load_scene(module_name, scene_name)
+    cached_text("warm")
+
+
+def worker_ready():
+    return os.getpid()
+
+
+def render_job(module_name, scene_name, quality, first=None, last=None):
+    if first is None and last is None:
+        return render_scene(module_name, scene_name, quality)
+    first = first or 0
+    # manim treats -1 as "through the last animation"; render_scene stops
+    # an --upto 0 job after play 0, which manim would read as no limit
+    last = -1 if last is None else last
+    part = f"{scene_name}_{first:03d}-{last:03d}" if last >= 0 else f"{scene_name}_{first:03d}-end"
+    return render_scene(
+        module_name, scene_name, quality,
+        from_animation_number=first,
+        upto_animation_number=last,
+        output_file=part,
+        # Jobs for the same scene may run side by side, so keep their lists apart
+        partial_movie_dir="{video_dir}/partial_movie_files/" + part,
+    )
+
+
+class JobHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        for line in self.rfile:
+            try:
+                job = json.loads(line)
+                module_name = self.server.scenes[job["scene"]]
+            except KeyError as exc:
+                reply = {"error": f"unknown scene or missing field: {exc}"}
+            except Exception as exc:
+                reply = {"error": repr(exc)}
+            else:
+                try:
+                    future = self.server.pool.submit(
+                        render_job, module_name, job["scene"], job.get("quality", "h"),
+                        job.get("from"), job.get("upto"),
+                    )
+                    reply = future.result()
+                except Exception as exc:
+                    reply = {"error": repr(exc)}
+            self.wfile.write((json.dumps(reply) + "\n").encode())
+
+
+class RenderServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, path, pool, scenes):
+        self.pool = pool
+        # Scene name -> module; names are unique across the repo
+        self.scenes = {name: module for module, name in scenes}
+        super().__init__(path, JobHandler)
+
+
+def serve(path=SOCKET_PATH, jobs=os.cpu_count(), recycle=20):
+    scenes = discover_scenes()
+    if os.path.exists(path):
+        os.unlink(path)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with ProcessPoolExecutor(
+        max_workers=jobs, initializer=warm_worker, initargs=(scenes,), max_tasks_per_child=recycle
+    ) as pool:
+        # Workers start on demand, so fill the pool now and let each one
+        # warm up before the first real job arrives (the no-op counts
+        # toward --recycle)
+        for future in [pool.submit(worker_ready) for _ in range(jobs)]:
+            future.result()
+        with RenderServer(path, pool, scenes) as server:
+            print(f"Serving {len(scenes)} scenes on {path} with {jobs} workers (recycled every {recycle} jobs)")
+            try:
+                server.serve_forever()
+            except KeyboardInterrupt:
+                pass
+            finally:
+                os.unlink(path)
+
+
+def submit(job, path=SOCKET_PATH):
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(path)
+        with sock.makefile("rwb") as stream:
+            stream.write((json.dumps(job) + "\n").encode())
+            stream.flush()
+            return json.loads(stream.readline())
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Warm render worker daemon.")
+    parser.add_argument("--socket", default=SOCKET_PATH)
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    serve_cmd = commands.add_parser("serve", help="start the worker pool and listen")
+    serve_cmd.add_argument("-j", "--jobs", type=int, default=os.cpu_count())
+    serve_cmd.add_argument("--recycle", type=int, default=20, help="jobs per worker before it is replaced")
+
+    submit_cmd = commands.add_parser("submit", help="send one render job and wait for it")
+    submit_cmd.add_argument("scene")
+    submit_cmd.add_argument("-q", "--quality", default="h", choices=list("lmhpk"))
+    submit_cmd.add_argument("--from", dest="first", type=int, help="first play() index")
+    submit_cmd.add_argument("--upto", dest="last", type=int, help="last play() index, inclusive")
+    args = parser.parse_args(argv)
+
+    if args.command == "serve":
+        serve(args.socket, args.jobs, args.recycle)
+        return 0
+
+    result = submit(
+        {"scene": args.scene, "quality": args.quality, "from": args.first, "upto": args.last}, args.socket
+    )
+    if "error" in result:
+        print(f"FAILED {args.scene}: {result['error']}", file=sys.stderr)
+        return 1
+    print(f"done   {result['scene']} [{result['quality']}] in {result['wall_time']:.1f}s -> {result['output']}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
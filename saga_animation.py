@@ -1,5 +1,11 @@
 from manim import *
 
+from base_scene import ExplainerScene
+from fast_flash import FastFlash
+from lod import lod_segments
+from odometer import Odometer
+from text_cache import cached_text
+
 # --- Global Styles ---
 MAIN_FONT = "Inter"
 
@@ -13,18 +19,18 @@ FAIL_COLOR = "#F87171"
 TEXT_COLOR = "#F8FAFC"
 GRAY_COLOR = "#64748B"
 
-class SagaStory(Scene):
+class SagaStory(ExplainerScene):
     def construct(self):
         self.camera.background_color = BG_COLOR
 
         # --- Status Bar Helper ---
-        status_line = Text("", font=MAIN_FONT, font_size=22, color=TEXT_COLOR)
+        status_line = cached_text("", font=MAIN_FONT, font_size=22, color=TEXT_COLOR)
         status_line.to_edge(DOWN, buff=0.4)
         self.add(status_line)
 
         # --- INTRO: Title ---
-        title = Text("Saga Choreography", font=MAIN_FONT, weight=BOLD, font_size=48, color=NODE_COLOR)
-        subtitle = Text("Decentralized Transaction Management", font=MAIN_FONT, font_size=20, color=GRAY_COLOR)
+        title = cached_text("Saga Choreography", font=MAIN_FONT, weight=BOLD, font_size=48, color=NODE_COLOR)
+        subtitle = cached_text("Decentralized Transaction Management", font=MAIN_FONT, font_size=20, color=GRAY_COLOR)
         subtitle.next_to(title, DOWN)
         
         self.play(FadeIn(title, shift=UP*0.3), run_time=0.5)
@@ -39,14 +45,14 @@ class SagaStory(Scene):
         # --- SETUP: Services Architecture ---
         # Booking Service (Left)
         booking_box = RoundedRectangle(height=1.8, width=2.8, corner_radius=0.15, color=NODE_COLOR, stroke_width=3, fill_opacity=0.1)
-        booking_lbl = Text("Booking\nService", font=MAIN_FONT, font_size=18, color=NODE_COLOR).move_to(booking_box)
-        booking_icon = Text("📅", font_size=28).next_to(booking_lbl, UP, buff=0.15)
+        booking_lbl = cached_text("Booking\nService", font=MAIN_FONT, font_size=18, color=NODE_COLOR).move_to(booking_box)
+        booking_icon = cached_text("📅", font_size=28).next_to(booking_lbl, UP, buff=0.15)
         booking_svc = VGroup(booking_box, booking_lbl, booking_icon).shift(LEFT * 3.5 + UP * 0.3)
 
         # Discount Service (Right)
         discount_box = RoundedRectangle(height=1.8, width=2.8, corner_radius=0.15, color=SEC_COLOR, stroke_width=3, fill_opacity=0.1)
-        discount_lbl = Text("Discount\nService", font=MAIN_FONT, font_size=18, color=SEC_COLOR).move_to(discount_box)
-        discount_icon = Text("%", font_size=32).next_to(discount_lbl, UP, buff=0.15)
+        discount_lbl = cached_text("Discount\nService", font=MAIN_FONT, font_size=18, color=SEC_COLOR).move_to(discount_box)
+        discount_icon = cached_text("%", font_size=32).next_to(discount_lbl, UP, buff=0.15)
         discount_svc = VGroup(discount_box, discount_lbl, discount_icon).shift(RIGHT * 3.5 + UP * 0.3)
 
         self.play(
@@ -56,23 +62,26 @@ class SagaStory(Scene):
         )
 
         # "No Global Transaction" label
-        no_global = Text("No Global Transaction ⚠️", font=MAIN_FONT, font_size=16, color=FAIL_COLOR, slant=ITALIC)
+        no_global = cached_text("No Global Transaction ⚠️", font=MAIN_FONT, font_size=16, color=FAIL_COLOR, slant=ITALIC)
         no_global.move_to(UP * 2)
         self.play(FadeIn(no_global, shift=DOWN*0.2), run_time=0.5)
         self.wait(0.3)
 
         # --- REDIS: The Quota Tracker ---
         # Redis visualization
+        # Arcs default to 9 components (8 cubics); previews keep 4 cubics,
+        # a quarter turn each around the full ellipse
+        arc_segments = lod_segments(9, minimum=5)
         redis_outline = VGroup(
-            Ellipse(width=1.3, height=0.45, color=DB_COLOR, stroke_width=3),
+            Ellipse(width=1.3, height=0.45, color=DB_COLOR, stroke_width=3, num_components=arc_segments),
             Line(LEFT*0.65, LEFT*0.65 + DOWN*0.9, color=DB_COLOR, stroke_width=3),
             Line(RIGHT*0.65, RIGHT*0.65 + DOWN*0.9, color=DB_COLOR, stroke_width=3),
-            Arc(radius=0.65, start_angle=PI, angle=PI, color=DB_COLOR, stroke_width=3).stretch(0.35, 1).shift(DOWN*0.9)
+            Arc(radius=0.65, start_angle=PI, angle=PI, color=DB_COLOR, stroke_width=3, num_components=arc_segments).stretch(0.35, 1).shift(DOWN*0.9)
         ).shift(DOWN * 2.2)
         
-        redis_lbl = Text("Redis", font=MAIN_FONT, font_size=16, color=DB_COLOR, weight=BOLD).next_to(redis_outline, LEFT, buff=0.3)
-        redis_quota_lbl = Text("Quota:", font=MAIN_FONT, font_size=14, color=GRAY_COLOR).move_to(redis_outline).shift(UP*0.15)
-        redis_val = Text("1", font=MAIN_FONT, font_size=36, color=SUCCESS_COLOR, weight=BOLD).move_to(redis_outline).shift(DOWN*0.2)
+        redis_lbl = cached_text("Redis", font=MAIN_FONT, font_size=16, color=DB_COLOR, weight=BOLD).next_to(redis_outline, LEFT, buff=0.3)
+        redis_quota_lbl = cached_text("Quota:", font=MAIN_FONT, font_size=14, color=GRAY_COLOR).move_to(redis_outline).shift(UP*0.15)
+        redis_val = Odometer(1, color=SUCCESS_COLOR, font=MAIN_FONT, font_size=36, weight=BOLD).move_to(redis_outline).shift(DOWN*0.2)
         redis_grp = VGroup(redis_outline, redis_lbl, redis_quota_lbl, redis_val)
         
         self.play(FadeIn(redis_grp, shift=UP*0.3), run_time=0.6)
@@ -81,12 +90,12 @@ class SagaStory(Scene):
         # --- THE RACE: Two Users ---
         # User A (Success - Green theme)
         user_a_circle = Circle(radius=0.35, color=SUCCESS_COLOR, fill_opacity=0.2, stroke_width=3)
-        user_a_txt = Text("A", font_size=20, color=SUCCESS_COLOR, weight=BOLD)
+        user_a_txt = cached_text("A", font_size=20, color=SUCCESS_COLOR, weight=BOLD)
         user_a = VGroup(user_a_circle, user_a_txt).move_to(LEFT * 3.5 + UP * 2.5)
 
         # User B (Will fail - Red theme)
         user_b_circle = Circle(radius=0.35, color=FAIL_COLOR, fill_opacity=0.2, stroke_width=3)
-        user_b_txt = Text("B", font_size=20, color=FAIL_COLOR, weight=BOLD)
+        user_b_txt = cached_text("B", font_size=20, color=FAIL_COLOR, weight=BOLD)
         user_b = VGroup(user_b_circle, user_b_txt).move_to(RIGHT * 3.5 + UP * 2.5)
         
         self.play(
@@ -113,8 +122,8 @@ class SagaStory(Scene):
             run_time=0.3
         )
         
-        pending_a = Text("A: Pending", font=MAIN_FONT, font_size=16, color=SUCCESS_COLOR).move_to(booking_box).shift(UP*0.3)
-        pending_b = Text("B: Pending", font=MAIN_FONT, font_size=16, color=FAIL_COLOR).move_to(booking_box).shift(DOWN*0.3)
+        pending_a = cached_text("A: Pending", font=MAIN_FONT, font_size=16, color=SUCCESS_COLOR).move_to(booking_box).shift(UP*0.3)
+        pending_b = cached_text("B: Pending", font=MAIN_FONT, font_size=16, color=FAIL_COLOR).move_to(booking_box).shift(DOWN*0.3)
         
         self.play(
             FadeIn(pending_a, shift=DOWN*0.2),
@@ -129,9 +138,10 @@ class SagaStory(Scene):
             discount_box.get_left() + UP*0.3,
             angle=-TAU/5,
             color=TEXT_COLOR,
-            stroke_width=3
+            stroke_width=3,
+            num_components=lod_segments(9)
         )
-        event_lbl = Text("OrderCreated", font=MAIN_FONT, font_size=15, color=TEXT_COLOR, slant=ITALIC)
+        event_lbl = cached_text("OrderCreated", font=MAIN_FONT, font_size=15, color=TEXT_COLOR, slant=ITALIC)
         event_lbl.next_to(event_arrow, UP, buff=0.1)
         
         self.play(Create(event_arrow), Write(event_lbl), run_time=0.6)
@@ -153,18 +163,17 @@ class SagaStory(Scene):
         )
         
         # Redis goes to 0
-        redis_zero = Text("0", font=MAIN_FONT, font_size=36, color=FAIL_COLOR, weight=BOLD).move_to(redis_val)
-        self.play(Transform(redis_val, redis_zero), run_time=0.4)
+        self.play(redis_val.roll_to(0, color=FAIL_COLOR, direction=DOWN), run_time=0.4)
         self.wait(0.2)
 
         # User B fails
         self.play(
-            Flash(redis_val, color=FAIL_COLOR, flash_radius=0.5),
+            FastFlash(redis_val, color=FAIL_COLOR, flash_radius=0.5),
             check_b.animate.set_stroke(width=5),
             run_time=0.5
         )
         
-        x_mark = Text("❌", font_size=40, color=FAIL_COLOR).next_to(discount_box, RIGHT, buff=0.3)
+        x_mark = cached_text("❌", font_size=40, color=FAIL_COLOR).next_to(discount_box, RIGHT, buff=0.3)
         self.play(FadeIn(x_mark, scale=0.3), run_time=0.4)
         self.wait(0.3)
         
@@ -178,9 +187,10 @@ class SagaStory(Scene):
             booking_box.get_right() + DOWN*0.3,
             angle=-TAU/5,
             color=FAIL_COLOR,
-            stroke_width=4
+            stroke_width=4,
+            num_components=lod_segments(9)
         )
-        rollback_lbl = Text("DiscountFailed", font=MAIN_FONT, font_size=15, color=FAIL_COLOR, weight=BOLD, slant=ITALIC)
+        rollback_lbl = cached_text("DiscountFailed", font=MAIN_FONT, font_size=15, color=FAIL_COLOR, weight=BOLD, slant=ITALIC)
         rollback_lbl.next_to(rollback_arrow, DOWN, buff=0.1)
         
         self.play(Create(rollback_arrow), Write(rollback_lbl), run_time=0.6)
@@ -196,14 +206,14 @@ class SagaStory(Scene):
             run_time=0.4
         )
         
-        cancelled = Text("CANCELLED", font=MAIN_FONT, font_size=13, color=FAIL_COLOR, weight=BOLD)
+        cancelled = cached_text("CANCELLED", font=MAIN_FONT, font_size=13, color=FAIL_COLOR, weight=BOLD)
         cancelled.move_to(pending_b)
         self.play(FadeOut(pending_b), FadeIn(cancelled), run_time=0.3)
 
         # User A confirmed
         
-        check_mark = Text("✓", font_size=24, color=SUCCESS_COLOR, weight=BOLD).next_to(pending_a, RIGHT, buff=0.2)
-        confirmed = Text("CONFIRMED", font=MAIN_FONT, font_size=13, color=SUCCESS_COLOR, weight=BOLD)
+        check_mark = cached_text("✓", font_size=24, color=SUCCESS_COLOR, weight=BOLD).next_to(pending_a, RIGHT, buff=0.2)
+        confirmed = cached_text("CONFIRMED", font=MAIN_FONT, font_size=13, color=SUCCESS_COLOR, weight=BOLD)
         confirmed.next_to(pending_a, DOWN, buff=0.2)
         
         self.play(
@@ -230,8 +240,8 @@ class SagaStory(Scene):
         self.wait(0.3)
 
         final_msg = VGroup(
-            Text("Saga: Each service handles its own rollback", font=MAIN_FONT, font_size=24, color=TEXT_COLOR),
-            Text("No central coordinator needed", font=MAIN_FONT, font_size=20, color=GRAY_COLOR)
+            cached_text("Saga: Each service handles its own rollback", font=MAIN_FONT, font_size=24, color=TEXT_COLOR),
+            cached_text("No central coordinator needed", font=MAIN_FONT, font_size=20, color=GRAY_COLOR)
         ).arrange(DOWN, buff=0.2)
         final_msg.to_edge(DOWN, buff=0.5)
         
@@ -1,5 +1,9 @@
 from manim import *
 
+from base_scene import ExplainerScene
+from mesh import FullMesh
+from text_cache import cached_text
+
 # --- Global Styles ---
 MAIN_FONT = "Inter"
 
@@ -12,15 +16,20 @@ CHAOS_COLOR = "#F471B5"    # Soft Rose (The "Shouting" lines - distinct but not
 CLEAN_COLOR = "#34D399"    # Emerald Green (The "Efficient" lines)
 TEXT_COLOR = "#F8FAFC"     # Off-White
 
-class SFUExplainer(Scene):
+class SFUExplainer(ExplainerScene):
+    # The longer cut uses 50-200 participants
+    num_users = 5
+    # Above this many users the numbered labels would not fit
+    max_labeled_users = 12
+
     def construct(self):
         self.camera.background_color = BG_COLOR
 
         # --- PART 1: The Concept ("SFU / Traffic Controller") ---
         
         # 1. Title
-        title = Text("SFU", font=MAIN_FONT, weight=BOLD, font_size=70, color=SFU_COLOR)
-        subtitle = Text("Selective Forwarding Unit", font=MAIN_FONT, font_size=30, color=TEXT_COLOR)
+        title = cached_text("SFU", font=MAIN_FONT, weight=BOLD, font_size=70, color=SFU_COLOR)
+        subtitle = cached_text("Selective Forwarding Unit", font=MAIN_FONT, font_size=30, color=TEXT_COLOR)
         subtitle.next_to(title, DOWN, buff=0.3)
         
         self.play(Write(title), FadeIn(subtitle, shift=UP*0.2), run_time=1)
@@ -31,39 +40,39 @@ class SFUExplainer(Scene):
         self.play(header.animate.scale(0.5).to_corner(UL), run_time=0.8)
 
         # 2. The Metaphor Text
-        metaphor_text = Text("The Traffic Controller", font=MAIN_FONT, color=SFU_COLOR, font_size=36)
+        metaphor_text = cached_text("The Traffic Controller", font=MAIN_FONT, color=SFU_COLOR, font_size=36)
         metaphor_text.to_edge(UP)
         self.play(Write(metaphor_text))
 
         # --- PART 2: The "Before" - Mesh Chaos ("Everyone Shouting") ---
 
-        # Create 5 Users arranged in a circle
+        # Create the Users arranged in a circle
+        n = self.num_users
         users = VGroup()
         radius = 2.5
-        for i in range(5):
+        # Shrink the icons once the ring gets crowded
+        node_radius = min(0.3, 0.8 * radius * np.sin(PI / n))
+        for i in range(n):
             # Create a user icon (Circle with a letter)
-            dot = Circle(radius=0.3, color=NODE_COLOR, fill_opacity=0).set_fill(color=NODE_COLOR, opacity=0.2)
-            dot.set_stroke(width=4)
-            label = Text(str(i+1), font=MAIN_FONT, font_size=20, color=TEXT_COLOR).move_to(dot.center())
-            user = VGroup(dot, label)
+            dot = Circle(radius=node_radius, color=NODE_COLOR, fill_opacity=0).set_fill(color=NODE_COLOR, opacity=0.2)
+            dot.set_stroke(width=4 * node_radius / 0.3)
+            user = VGroup(dot)
+            if n <= self.max_labeled_users:
+                user.add(cached_text(str(i+1), font=MAIN_FONT, font_size=20, color=TEXT_COLOR).move_to(dot.center()))
             
             # Position in a circle
-            angle = i * (2 * PI / 5) + PI/2
+            angle = i * (2 * PI / n) + PI/2
             user.move_to(np.array([np.cos(angle)*radius, np.sin(angle)*radius, 0]))
             users.add(user)
 
         self.play(FadeIn(users, scale=0.8))
 
         # Create the Chaos Lines (Full Mesh)
-        chaos_lines = VGroup()
-        for i in range(len(users)):
-            for j in range(i + 1, len(users)):
-                line = Line(users[i].get_center(), users[j].get_center(), color=CHAOS_COLOR)
-                line.set_stroke(width=2, opacity=0.6)
-                chaos_lines.add(line)
+        chaos_lines = FullMesh(users, color=CHAOS_COLOR)
+        chaos_lines.set_stroke(width=2, opacity=0.6)
 
         # Animate "Shouting"
-        chaos_label = Text("Mesh Network: Chaos", font=MAIN_FONT, font_size=24, color=CHAOS_COLOR)
+        chaos_label = cached_text("Mesh Network: Chaos", font=MAIN_FONT, font_size=24, color=CHAOS_COLOR)
         chaos_label.next_to(users, DOWN, buff=0.5)
 
         self.play(Create(chaos_lines, lag_ratio=0.1), run_time=1.5)
@@ -71,10 +80,7 @@ class SFUExplainer(Scene):
         
         # Wiggle the lines to show "Shouting/Noise"
         self.play(
-            *[line.animate.put_start_and_end_on(
-                line.get_start() + np.random.randn(3)*0.05, 
-                line.get_end() + np.random.randn(3)*0.05
-            ) for line in chaos_lines],
+            chaos_lines.jitter(amplitude=0.05),
             run_time=0.5,
             rate_func=there_and_back
         )
@@ -93,7 +99,7 @@ class SFUExplainer(Scene):
         # 2. Introduce the SFU (Central Node)
         sfu_box = RoundedRectangle(corner_radius=0.2, height=1.2, width=1.2, color=SFU_COLOR, stroke_width=6)
         sfu_box.set_fill(color=SFU_COLOR, opacity=0.15)
-        sfu_text = Text("SFU", font=MAIN_FONT, weight=BOLD, font_size=24, color=SFU_COLOR).move_to(sfu_box.center())
+        sfu_text = cached_text("SFU", font=MAIN_FONT, weight=BOLD, font_size=24, color=SFU_COLOR).move_to(sfu_box.center())
         sfu_node = VGroup(sfu_box, sfu_text)
 
         self.play(GrowFromCenter(sfu_node), run_time=0.8)
@@ -122,7 +128,7 @@ class SFUExplainer(Scene):
         # --- PART 4: Bandwidth Savings ---
 
         # Visual cleanup
-        final_text = Text("Huge Bandwidth Saved", font=MAIN_FONT, weight=BOLD, font_size=32, color=CLEAN_COLOR)
+        final_text = cached_text("Huge Bandwidth Saved", font=MAIN_FONT, weight=BOLD, font_size=32, color=CLEAN_COLOR)
         final_text.add_background_rectangle(color=BG_COLOR, buff=0.2, opacity=0.9)
         final_text.move_to(DOWN * 2.5)
 
@@ -1,15 +1,23 @@
 from manim import *
-import random
 import numpy as np
 
-class STReveal(Scene):
+from base_scene import ExplainerScene
+from fast_flash import FastFlash
+from glyph_rain import GlyphField
+from lod import lod_count
+from particles import ParticleSystem
+from text_cache import cached_text
+
+class STReveal(ExplainerScene):
+    intro_particles = 25
+
     def construct(self):
         # Vibrant gradient background (cyberpunk vibes)
         self.camera.background_color = "#0a0e27"
         
         # Create main "ST" with cyberpunk font style
-        s = Text("S", font="Arial Black", weight=BOLD).scale(3.5)
-        t = Text("T", font="Arial Black", weight=BOLD).scale(3.5)
+        s = cached_text("S", font="Arial Black", weight=BOLD).scale(3.5)
+        t = cached_text("T", font="Arial Black", weight=BOLD).scale(3.5)
         
         # Initial glitch colors
         s.set_color_by_gradient("#ff006e", "#8338ec")
@@ -19,32 +27,26 @@ class STReveal(Scene):
         st.move_to(ORIGIN)
         
         # Neon glow circles (particle effect)
-        circles = VGroup(*[
-            Circle(radius=0.15, color=random.choice(["#ff006e", "#8338ec", "#3a86ff", "#06ffa5"]), 
-                   fill_opacity=0.8, stroke_width=0)
-            .move_to([
-                np.random.uniform(-4, 4),
-                np.random.uniform(-4, 4),
-                0
-            ])
-            for _ in range(25)
-        ])
+        circles = ParticleSystem.scattered(
+            lod_count(self.intro_particles, minimum=8),
+            colors=["#ff006e", "#8338ec", "#3a86ff", "#06ffa5"],
+            x_range=(-4, 4), y_range=(-4, 4),
+            radius=0.15, opacity=0.8
+        )
         
         # Rotating hexagon (tech frame)
         hexagon = RegularPolygon(n=6, color="#06ffa5", stroke_width=4, fill_opacity=0)
         hexagon.scale(2.8).rotate(PI/6)
         
         # Binary code rain (matrix style)
-        binary_texts = VGroup(*[
-            Text(
-                "".join([str(np.random.randint(0, 2)) for _ in range(3)]),
-                font="Courier New",
-                color="#06ffa5",
-                font_size=20
-            ).move_to([np.random.uniform(-5, 5), np.random.uniform(-3, 4), 0])
-            .set_opacity(0.4)
-            for _ in range(15)
-        ])
+        binary_texts = GlyphField.random_strings(
+            15,
+            length=3,
+            font="Courier New",
+            color="#06ffa5",
+            font_size=20,
+            opacity=0.4
+        )
         
         # Glitch lines
         glitch_lines = VGroup(*[
@@ -70,7 +72,7 @@ class STReveal(Scene):
         # 2. Particles explode inward
         self.add(circles)
         self.play(
-            *[circle.animate.move_to(ORIGIN).set_opacity(0) for circle in circles],
+            circles.implode(ORIGIN),
             run_time=0.8,
             rate_func=rush_into
         )
@@ -125,7 +127,7 @@ class STReveal(Scene):
         
         # 9. Final glitch burst
         self.play(
-            *[Flash(letter, color="#06ffa5", line_length=0.3) for letter in [s, t]],
+            FastFlash([s, t], color="#06ffa5", line_length=0.3),
             run_time=0.4
         )
         
@@ -133,17 +135,15 @@ class STReveal(Scene):
         self.wait(0.4)
         
         # 11. Particles explode outward
-        new_circles = VGroup(*[
-            Circle(radius=0.1, color=random.choice(["#ff006e", "#06ffa5"]), 
-                   fill_opacity=0.9, stroke_width=0)
-            .move_to(ORIGIN)
-            for _ in range(20)
-        ])
+        new_circles = ParticleSystem.scattered(
+            lod_count(20, minimum=8),
+            colors=["#ff006e", "#06ffa5"],
+            x_range=(0, 0), y_range=(0, 0), speed=5,
+            radius=0.1, opacity=0.9
+        )
         self.add(new_circles)
         self.play(
-            *[circle.animate.shift(
-                [np.random.uniform(-5, 5), np.random.uniform(-5, 5), 0]
-            ).set_opacity(0) for circle in new_circles],
+            new_circles.burst(),
             FadeOut(st),
             FadeOut(hexagon),
             FadeOut(binary_texts),
@@ -0,0 +1,103 @@
+# --- Storyboards ---
+# Runs construct() in skip mode, where every animation jumps straight to
+# its final state and no intermediate frame is drawn or written. (manim
+# still rasterizes the static mobjects once per play while skipping.) The
+# end state of each play() and wait() is drawn once more and laid out in
+# a numbered contact sheet with timestamps, at
+# media/storyboards/<Scene>.png.
+#
+#   python storyboard.py race_condition_animated.RaceConditionAnimated
+#   python storyboard.py saga_animation.SagaStory --columns 5 --width 320
+
+import argparse
+import math
+import sys
+import time
+
+from PIL import Image, ImageDraw
+
+from render_all import MEDIA_DIR, load_scene, scene_config
+
+BACKGROUND = (18, 18, 18)
+CAPTION = (220, 220, 220)
+
+
+def capture_storyboard(module_name, scene_name, quality):
+    from manim import tempconfig
+
+    base = load_scene(module_name, scene_name)
+
+    class Storyboard(base):
+        def play(self, *args, **kwargs):
+            super().play(*args, **kwargs)
+            # A frozen-frame wait() leaves the static image behind; drawing
+            # on top of it would paint every mobject twice
+            self.renderer.static_image = None
+            self.renderer.update_frame(self, ignore_skipping=True)
+            self.panels.append({
+                "index": self.renderer.num_plays - 1,
+                "time": self.renderer.time,
+                "animations": [type(a).__name__ for a in (getattr(self, "animations", None) or [])],
+                "image": self.renderer.camera.get_image().convert("RGB"),
+            })
+
+    overrides = {"write_to_movie": False, "save_last_frame": False, "disable_caching": True}
+    with tempconfig(scene_config(module_name, quality, **overrides)):
+        scene = Storyboard(skip_animations=True)
+        scene.panels = []
+        scene.render()
+    return scene.panels
+
+
+def contact_sheet(panels, title, columns=4, width=480, pad=10, caption_height=20):
+    thumbs = [
+        p["image"].resize((width, round(p["image"].height * width / p["image"].width)), Image.LANCZOS)
+        for p in panels
+    ]
+    height = max((t.height for t in thumbs), default=0)
+    rows = math.ceil(len(thumbs) / columns)
+    header = caption_height + pad
+    sheet = Image.new(
+        "RGB",
+        (pad + columns * (width + pad), header + pad + rows * (height + caption_height + pad)),
+        BACKGROUND,
+    )
+    draw = ImageDraw.Draw(sheet)
+    draw.text((pad, pad), title, fill=CAPTION)
+    for n, (panel, thumb) in enumerate(zip(panels, thumbs)):
+        x = pad + (n % columns) * (width + pad)
+        y = header + pad + (n // columns) * (height + caption_height + pad)
+        sheet.paste(thumb, (x, y))
+        label = f"#{panel['index']:03d}  {panel['time']:6.2f}s  {'+'.join(panel['animations']) or 'play'}"
+        draw.text((x, y + height + 4), label, fill=CAPTION)
+    return sheet
+
+
+def storyboard(module_name, scene_name, quality="l", columns=4, width=480):
+    start = time.perf_counter()
+    panels = capture_storyboard(module_name, scene_name, quality)
+    total = panels[-1]["time"] if panels else 0.0
+    sheet = contact_sheet(panels, f"{scene_name} - {len(panels)} steps, {total:.1f}s", columns, width)
+    out_dir = MEDIA_DIR / "storyboards"
+    out_dir.mkdir(parents=True, exist_ok=True)
+    path = out_dir / f"{scene_name}.png"
+    sheet.save(path)
+    print(f"{scene_name}: {len(panels)} panels in {time.perf_counter() - start:.1f}s -> {path}")
+    return path
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Contact sheet of every play()'s end state.")
+    parser.add_argument("scene", help="module.SceneName, e.g. saga_animation.SagaStory")
+    parser.add_argument("-q", "--quality", default="l", choices=list("lmhpk"))
+    parser.add_argument("--columns", type=int, default=4)
+    parser.add_argument("--width", type=int, default=480, help="panel width in pixels")
+    args = parser.parse_args(argv)
+
+    module_name, scene_name = args.scene.rsplit(".", 1)
+    storyboard(module_name, scene_name, args.quality, args.columns, args.width)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
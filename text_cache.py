@@ -0,0 +1,108 @@
+# --- Keyed Text cache ---
+# Text() goes through Pango and SVG parsing on every call, even for strings
+# the scenes have already built with the same font, size, weight and color.
+# cached_text() keeps built Text mobjects in a bounded LRU and hands out
+# copies of the glyph geometry. Misses fall through to a pickle store under
+# media/text_cache so the next run (or another worker) starts warm.
+#
+# TEXT_CACHE_SIZE bounds the in-process LRU (default 512 entries),
+# TEXT_CACHE_DISK=off disables the on-disk layer.
+
+import hashlib
+import os
+import pickle
+from collections import OrderedDict
+from pathlib import Path
+
+from manim import Text, __version__ as manim_version, config, logger
+
+
+class TextCache:
+    def __init__(self, maxsize=512, use_disk=True):
+        self.maxsize = maxsize
+        self.use_disk = use_disk
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    def text(self, text, **kwargs):
+        key = self._key(text, kwargs)
+        mob = self._entries.get(key)
+        if mob is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return mob.copy()
+
+        mob = self._load(key)
+        if mob is not None:
+            self.disk_hits += 1
+        else:
+            self.misses += 1
+            mob = Text(text, **kwargs)
+            self._store(key, mob)
+
+        self._entries[key] = mob
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+        return mob.copy()
+
+    def stats(self):
+        return {
+            "hits": self.hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "entries": len(self._entries),
+        }
+
+    def clear(self):
+        self._entries.clear()
+
+    # --- Helpers ---
+
+    def _key(self, text, kwargs):
+        # repr() keeps colors, weights and slants distinct whatever their type
+        parts = [manim_version, text] + [f"{k}={v!r}" for k, v in sorted(kwargs.items())]
+        return hashlib.sha1("\x1f".join(parts).encode("utf-8")).hexdigest()
+
+    def _path(self, key):
+        return Path(config.media_dir) / "text_cache" / f"{key}.pkl"
+
+    def _load(self, key):
+        if not self.use_disk:
+            return None
+        path = self._path(key)
+        try:
+            with path.open("rb") as f:
+                return pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as exc:
+            logger.debug(f"Dropping unreadable text cache entry {path.name}: {exc!r}")
+            path.unlink(missing_ok=True)
+            return None
+
+    def _store(self, key, mob):
+        if not self.use_disk:
+            return
+        path = self._path(key)
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with tmp.open("wb") as f:
+                pickle.dump(mob, f, protocol=pickle.HIGHEST_PROTOCOL)
+            # Atomic rename so parallel workers never read a half-written file
+            tmp.replace(path)
+        except Exception as exc:
+            tmp.unlink(missing_ok=True)
+            logger.debug(f"Could not persist text cache entry: {exc!r}")
+
+
+TEXT_CACHE = TextCache(
+    maxsize=int(os.environ.get("TEXT_CACHE_SIZE", "512")),
+    use_disk=os.environ.get("TEXT_CACHE_DISK", "on").lower() not in ("0", "off", "false"),
+)
+
+
+def cached_text(text, **kwargs):
+    return TEXT_CACHE.text(text, **kwargs)
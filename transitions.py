@@ -0,0 +1,98 @@
+# --- Scene-level transitions ---
+# clear_stage() replaces the `*[FadeOut(mob) for mob in self.mobjects]`
+# idiom. It rasterizes the current stage once into a premultiplied
+# buffer, drops every mobject, and fades that single snapshot out. There
+# is one animation and one pixel buffer no matter how many mobjects (or
+# updater-driven backgrounds) were on stage. The fade only changes the
+# snapshot's opacity, zoom and center; the camera paints the untouched
+# buffer with one Cairo paint_with_alpha per frame, so the pixels are
+# never copied, converted to float, or resampled through PIL.
+
+import hashlib
+
+import cairo
+from manim import *
+
+
+class StageSnapshot(Mobject):
+    def __init__(self, pixels, center, width, height, **kwargs):
+        super().__init__(**kwargs)
+        self.pixels = pixels
+        self.digest = hashlib.blake2b(pixels.tobytes(), digest_size=16).hexdigest()
+        self.opacity = 1.0
+        self.zoom = 1.0
+        # The frame corners are the only points, so shift()/move_to() and
+        # culling see the area the snapshot covers
+        corners = np.array([UL, UR, DR, DL], dtype=float) * [width / 2, height / 2, 0]
+        self.points = corners + center
+
+    @property
+    def snapshot_key(self):
+        # Picked up by the layer cache and play hashes through STYLE_ATTRS
+        return (self.digest, self.opacity, self.zoom)
+
+
+class SnapshotFade(Animation):
+    def __init__(self, snapshot, shift=ORIGIN, scale=1, **kwargs):
+        self.shift_vector = np.array(shift, dtype=float)
+        self.target_zoom = scale
+        super().__init__(snapshot, remover=True, **kwargs)
+
+    def create_starting_mobject(self):
+        # Start state is kept as plain values in begin(), no deep copy needed
+        return self.mobject
+
+    def begin(self):
+        self.start_points = self.mobject.points.copy()
+        self.start_zoom = self.mobject.zoom
+        self.start_opacity = self.mobject.opacity
+        super().begin()
+
+    def interpolate_mobject(self, alpha):
+        t = self.rate_func(alpha)
+        snapshot = self.mobject
+        snapshot.points[:] = self.start_points + self.shift_vector * t
+        snapshot.zoom = interpolate(self.start_zoom, self.target_zoom, t)
+        snapshot.opacity = self.start_opacity * (1 - t)
+
+
+class SnapshotCameraMixin:
+    def type_or_raise(self, mobject):
+        mob_type = super().type_or_raise(mobject)
+        # Camera rebuilds display_funcs inside type_or_raise, so register every time
+        self.display_funcs[StageSnapshot] = self.display_stage_snapshots
+        return StageSnapshot if isinstance(mobject, StageSnapshot) else mob_type
+
+    def display_stage_snapshots(self, snapshots, pixel_array):
+        ctx = self.get_cairo_context(pixel_array)
+        pw, ph = self.pixel_width, self.pixel_height
+        for snapshot in snapshots:
+            if snapshot.opacity <= 0:
+                continue
+            height, width = snapshot.pixels.shape[:2]
+            surface = cairo.ImageSurface.create_for_data(snapshot.pixels, cairo.FORMAT_ARGB32, width, height)
+            ctx.save()
+            # The context maps scene units to pixels; map snapshot pixels
+            # back onto the frame around the snapshot's center
+            x, y = snapshot.get_center()[:2]
+            ctx.translate(x, y)
+            ctx.scale(snapshot.zoom * self.frame_width / pw, -snapshot.zoom * self.frame_height / ph)
+            ctx.translate(-width / 2, -height / 2)
+            ctx.set_source_surface(surface, 0, 0)
+            ctx.paint_with_alpha(snapshot.opacity)
+            ctx.restore()
+
+
+class StageTransitionMixin:
+    def stage_snapshot(self):
+        camera = self.camera
+        buffer = np.zeros_like(camera.pixel_array)
+        camera.rasterize(camera.get_mobjects_to_display(self.mobjects), buffer)
+        # Cairo contexts are cached by array id, which may be reused
+        camera.pixel_array_to_cairo_context.pop(id(buffer), None)
+        return StageSnapshot(buffer, camera.frame_center, camera.frame_width, camera.frame_height)
+
+    def clear_stage(self, shift=ORIGIN, scale=1, run_time=1.0, **kwargs):
+        snapshot = self.stage_snapshot()
+        self.clear()
+        self.play(SnapshotFade(snapshot, shift=shift, scale=scale), run_time=run_time, **kwargs)
@@ -0,0 +1,88 @@
+# --- Small ffmpeg helpers shared by the render tools ---
+
+import json
+import shutil
+import subprocess
+import tempfile
+from pathlib import Path
+
+
+def ffmpeg_binary(name="ffmpeg"):
+    binary = shutil.which(name)
+    if binary is None:
+        raise RuntimeError(f"{name} was not found on PATH")
+    return binary
+
+
+def concat_movies(paths, output):
+    # Stream-copy join with the concat demuxer; inputs must share codec settings
+    output = Path(output)
+    with tempfile.NamedTemporaryFile("w", suffix=".txt", delete=False) as listing:
+        for path in paths:
+            listing.write(f"file '{Path(path).resolve()}'\n")
+    try:
+        subprocess.run(
+            [
+                ffmpeg_binary(), "-y", "-loglevel", "error",
+                "-f", "concat", "-safe", "0", "-i", listing.name,
+                "-c", "copy", "-movflags", "+faststart", str(output),
+            ],
+            check=True,
+        )
+    finally:
+        Path(listing.name).unlink(missing_ok=True)
+    return output
+
+
+# Stream parameters that must match for a stream-copy concat
+CONCAT_KEYS = ("codec_name", "profile", "level", "pix_fmt", "width", "height", "r_frame_rate", "time_base")
+
+# ffprobe's H.264 profile names -> libx264's -profile:v values
+X264_PROFILES = {
+    "Constrained Baseline": "baseline",
+    "Baseline": "baseline",
+    "Main": "main",
+    "High": "high",
+    "High 10": "high10",
+    "High 4:2:2": "high422",
+    "High 4:4:4 Predictive": "high444",
+}
+
+
+def probe_video(path):
+    result = subprocess.run(
+        [
+            ffmpeg_binary("ffprobe"), "-v", "error", "-select_streams", "v:0",
+            "-show_entries", "stream=" + ",".join(CONCAT_KEYS), "-of", "json", str(path),
+        ],
+        check=True, capture_output=True, text=True,
+    )
+    streams = json.loads(result.stdout)["streams"]
+    if not streams:
+        raise RuntimeError(f"No video stream in {path}")
+    return {key: streams[0].get(key) for key in CONCAT_KEYS}
+
+
+def reencode_like(path, output, params):
+    # Re-encode to the reference's size, rate, pixel format, profile, level
+    # and timescale (letterboxed if the aspect differs) so it can join a
+    # stream copy
+    if params["codec_name"] != "h264" or params["profile"] not in X264_PROFILES:
+        raise RuntimeError(f"Cannot re-encode to match {params['codec_name']} ({params['profile']})")
+    width, height = params["width"], params["height"]
+    timescale = params["time_base"].split("/")[1]
+    # ffprobe reports H.264 levels times ten (40 is level 4.0)
+    level = params.get("level") or 0
+    level_args = ["-level:v", f"{level / 10:.1f}"] if level > 0 else []
+    subprocess.run(
+        [
+            ffmpeg_binary(), "-y", "-loglevel", "error", "-i", str(path), "-an",
+            "-vf", f"scale={width}:{height}:force_original_aspect_ratio=decrease,"
+                   f"pad={width}:{height}:(ow-iw)/2:(oh-ih)/2",
+            "-r", params["r_frame_rate"], "-c:v", "libx264", "-profile:v", X264_PROFILES[params["profile"]],
+            *level_args, "-pix_fmt", params["pix_fmt"], "-crf", "23",
+            "-video_track_timescale", timescale, "-movflags", "+faststart", str(output),
+        ],
+        check=True,
+    )
+    return Path(output)
@@ -1,5 +1,9 @@
 from manim import *
 
+from base_scene import ExplainerScene
+from glow import set_glow
+from text_cache import cached_text
+
 # --- Global Styles ---
 MAIN_FONT = "Inter" # Ensure this font is installed, or change to "Arial" or "Sans-Serif"
 
@@ -11,18 +15,18 @@ P2P_COLOR = "#2DD4BF"
 TEXT_COLOR = "#FFFFFF"     
 ACCENT_RED = "#EF4444"     
 
-class WebRTCExplainerVibrant(Scene):
+class WebRTCExplainerVibrant(ExplainerScene):
     def construct(self):
         self.camera.background_color = BG_COLOR
 
         # --- PART 1: The Hook ---
         
         # Title Text
-        title = Text("WebRTC", font_size=80, font=MAIN_FONT, weight=BOLD, color=P2P_COLOR)
+        title = cached_text("WebRTC", font_size=80, font=MAIN_FONT, weight=BOLD, color=P2P_COLOR)
         # Fix: Use set_stroke method instead of init argument
         title.set_stroke(color=P2P_COLOR, width=1, opacity=0.5)
         
-        subtitle = Text("The backbone of it all.", font_size=32, font=MAIN_FONT, color=TEXT_COLOR)
+        subtitle = cached_text("The backbone of it all.", font_size=32, font=MAIN_FONT, color=TEXT_COLOR)
         subtitle.next_to(title, DOWN, buff=0.5)
 
         self.play(Write(title), run_time=0.8)
@@ -68,7 +72,7 @@ class WebRTCExplainerVibrant(Scene):
         
         # REJECT the server
         cross = Cross(server, stroke_color=ACCENT_RED, stroke_width=8)
-        no_text = Text("NO Middleman!", font=MAIN_FONT, weight=BOLD, color=ACCENT_RED, font_size=28).next_to(server, DOWN)
+        no_text = cached_text("NO Middleman!", font=MAIN_FONT, weight=BOLD, color=ACCENT_RED, font_size=28).next_to(server, DOWN)
         
         # Fix: Add background rectangle safely
         no_text.add_background_rectangle(color=BG_COLOR, buff=0.1)
@@ -101,12 +105,10 @@ class WebRTCExplainerVibrant(Scene):
             stroke_width=10
         )
         
-        # Fix: Apply glow manually
-        glow_copy = p2p_line.copy()
-        glow_copy.set_stroke(width=20, opacity=0.3)
-        p2p_line.add_to_back(glow_copy)
+        # Glow is a camera blur of the line's own raster, so ApplyWave moves it too
+        set_glow(p2p_line, radius=0.12, opacity=0.6)
 
-        p2p_label = Text("P2P Direct WebRTC", font=MAIN_FONT, weight=BOLD, font_size=28, color=P2P_COLOR).next_to(p2p_line, UP)
+        p2p_label = cached_text("P2P Direct WebRTC", font=MAIN_FONT, weight=BOLD, font_size=28, color=P2P_COLOR).next_to(p2p_line, UP)
 
         self.play(
             GrowFromCenter(p2p_line, point_color=P2P_COLOR), 
@@ -135,11 +137,10 @@ class WebRTCExplainerVibrant(Scene):
         icon.set_fill(color=BROWSER_COLOR, opacity=0.2)
         
         # Glow effect
-        glow = icon.copy()
-        glow.set_stroke(width=8, opacity=0.3)
+        set_glow(icon, radius=0.06, opacity=0.6)
         
-        label = Text(label_text, font=MAIN_FONT, weight=BOLD, font_size=24, color=TEXT_COLOR).next_to(icon, DOWN)
-        return VGroup(glow, icon, label)
+        label = cached_text(label_text, font=MAIN_FONT, weight=BOLD, font_size=24, color=TEXT_COLOR).next_to(icon, DOWN)
+        return VGroup(icon, label)
 
     def create_styled_server(self, label_text):
         # Fix: Moved fill_opacity to set_fill()
@@ -158,5 +159,5 @@ class WebRTCExplainerVibrant(Scene):
             lights.add(l)
 
         rack_group = VGroup(r1, r2, r3, lights)
-        label = Text(label_text, font=MAIN_FONT, font_size=20, color=SERVER_COLOR).next_to(rack_group, UP)
+        label = cached_text(label_text, font=MAIN_FONT, font_size=20, color=SERVER_COLOR).next_to(rack_group, UP)
         return VGroup(rack_group, label)
\ No newline at end of file